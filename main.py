@@ -10,7 +10,9 @@ Dependencies:
 """
 from __future__ import annotations
 
-import copy
+import functools
+import hashlib
+import heapq
 import html as _html
 import io
 import json
@@ -19,15 +21,18 @@ import math
 import os
 import queue
 import re
+import shutil
 import struct
 import subprocess
 import sys
 import threading
 import time
 import wave
-import base64
 import uuid
+import weakref
 import webbrowser
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s [%(name)s] %(message)s")
@@ -38,6 +43,16 @@ try:
 except ImportError:
     winsound = None
 
+try:
+    from pybase64 import b64encode as _b64encode   # SIMD encoder; much faster on large screenshots
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+try:
+    from orjson import loads as _json_loads   # several times faster on big steps.json files
+except ImportError:
+    from json import loads as _json_loads
+
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
@@ -75,16 +90,17 @@ log_data          = []
 event_queue       = queue.Queue()
 mouse_listener    = None
 keyboard_listener = None
-pressed_keys      = set()
+_pressed_mods     = set()   # held keys, partitioned on press so combos need no rescans
+_pressed_nonmods  = set()
 _keys_lock        = threading.Lock()
 
-# {step_index: [obj, ...]}
+# [[obj, ...] per step] — parallel to log_data
 # rect obj:  {type, color, width, x1, y1, x2, y2}  - coords in ORIGINAL image space
 # draw obj:  {type, color, width, points: [[x,y],...]}  - coords in ORIGINAL image space
-step_objects: dict = {}
+step_objects: list = []
 
-# {step_index: {x1, y1, x2, y2}}  — non-destructive crop in ORIGINAL image space
-step_crops: dict   = {}
+# [{x1, y1, x2, y2} or None per step] — non-destructive crop in ORIGINAL image space, parallel to log_data
+step_crops: list   = []
 
 # Fold state keyed by step id so it survives delete/reorder
 _card_folded: dict = {}
@@ -92,7 +108,7 @@ _card_folded: dict = {}
 # Annotations drawn on every screenshot (normalized 0–1 coords). Saved in session as global_overlay.json
 global_annotations: list = []
 
-# {step_index: [json_snapshot, ...]}
+# {step_index: [(objects, crop), ...]}
 undo_stacks: dict  = {}
 
 annotation_tool   = "none"  # "none"|"highlight"|"redact"|"crop"|"draw"
@@ -102,13 +118,19 @@ capture_keyboard  = False   # record key presses / shortcuts (off by default)
 ignore_psr_focus  = True    # skip recording input while a PSR window is active
 paused            = False   # recording is running but events are suppressed
 capture_delay_ms  = 100     # ms to wait before taking screenshot (lets menus/hovers render)
-capture_format    = "jpg"   # "jpg" (fast, smaller) or "png" (lossless)
+capture_format    = "jpg"   # "jpg" (fast, smaller) or "png" (lossless unless palette is on)
+capture_png_palette = False # quantize PNG captures to 256 colours (smaller, but lossy)
+html_image_quality = "lossless"  # HTML export images: "lossless" (PNG) | "high" | "medium" (WebP/JPEG)
 _last_capture     = [("", "", "", None)]  # (step, keyword, rest, color)
 
+# Lossy encoder quality per HTML export setting (None = PNG)
+_HTML_QUALITY = {"lossless": None, "high": 85, "medium": 70}
+
 from psr_settings import load_settings, save_settings as _save_settings_io
 
 def _load_recording_settings() -> None:
     global capture_on_click, capture_on_hotkey, capture_keyboard, ignore_psr_focus, capture_delay_ms, capture_format
+    global capture_png_palette, html_image_quality
     data = load_settings()
     if not data:
         return
@@ -124,6 +146,10 @@ def _load_recording_settings() -> None:
         capture_delay_ms = max(0, min(2000, int(data["capture_delay_ms"])))
     if data.get("capture_format") in ("jpg", "png"):
         capture_format = data["capture_format"]
+    if data.get("capture_png_palette") is not None:
+        capture_png_palette = bool(data["capture_png_palette"])
+    if data.get("html_image_quality") in _HTML_QUALITY:
+        html_image_quality = data["html_image_quality"]
 
 _load_recording_settings()
 
@@ -135,6 +161,8 @@ def _save_recording_settings() -> None:
         "ignore_psr_focus":  ignore_psr_focus,
         "capture_delay_ms":  capture_delay_ms,
         "capture_format":    capture_format,
+        "capture_png_palette": capture_png_palette,
+        "html_image_quality":  html_image_quality,
     })
 
 draw_color      = "#e74c3c"
@@ -146,6 +174,10 @@ _selected: set  = set()   # selected step indices (multi-select)
 _sel_anchor     = -1      # anchor for shift-range selection
 draw_color_btns = []
 pen_size_btns   = []
+_color_btn_map: dict = {}   # swatch hex → button (the custom picker has no entry)
+_pen_btn_map: dict   = {}   # pen width → button
+_painted_color  = [None]    # swatch / pen width currently drawn as selected
+_painted_width  = [None]
 view_mode       = "default"   # "default" | "list" | "grid"
 _prev_view_mode = ""          # set when jumping to detail via double-click
 
@@ -215,6 +247,7 @@ def tip(widget, text):
 
 # ══════════════════════════════════════ UTILS ══════════════════════════════════════
 
+@functools.lru_cache(maxsize=256)
 def _hex_to_rgb(h):
     h = h.lstrip("#")
     return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
@@ -226,12 +259,18 @@ def _obj_bbox_img(obj):
         x1, x2 = sorted([obj["x1"], obj["x2"]])
         y1, y2 = sorted([obj["y1"], obj["y2"]])
         return x1, y1, x2, y2
-    pts = obj["points"]
-    xs  = [p[0] for p in pts]
-    ys  = [p[1] for p in pts]
+    xs, ys = zip(*obj["points"])   # column-wise view of the stroke, one C-level pass
     return min(xs), min(ys), max(xs), max(ys)
 
 
+def _snapshot_obj(obj: dict) -> dict:
+    """Independent copy of an annotation object (cheaper than deepcopy: only draw points nest)."""
+    snap = dict(obj)
+    if obj["type"] == "draw":
+        snap["points"] = [list(p) for p in obj["points"]]
+    return snap
+
+
 def _step_id(entry: dict) -> str:
     """Stable id for a step (for fold state across rebuilds). Assigns id if missing."""
     if "id" not in entry:
@@ -241,7 +280,7 @@ def _step_id(entry: dict) -> str:
 
 def _get_crop(step_index: int, img_size: tuple[int, int] | None = None) -> tuple[int, int, int, int]:
     """Return (x1,y1,x2,y2) crop region in original image space, or full image."""
-    crop = step_crops.get(step_index)
+    crop = step_crops[step_index]
     if crop:
         return crop["x1"], crop["y1"], crop["x2"], crop["y2"]
     if img_size:
@@ -252,11 +291,30 @@ def _get_crop(step_index: int, img_size: tuple[int, int] | None = None) -> tuple
     return 0, 0, img.size[0], img.size[1]
 
 
-# Max size to decode for card thumbnails (avoids decoding 4K for a 860px-wide card)
-_CARD_DECODE_MAX = 1600
-_CARD_IMAGE_CACHE: dict = {}  # (path, mtime, crop_key) -> (PhotoImage, disp_size, orig_size)
+# (path, mtime, crop_key, max_w) -> (PhotoImage, disp_size, orig_size), least recently used first
+_CARD_IMAGE_CACHE: OrderedDict = OrderedDict()
 _CARD_CACHE_MAX = 50
 
+
+def _card_cache_key(step_index: int, img_path: str, mtime: float, max_w: int) -> tuple:
+    crop = step_crops[step_index]
+    crop_key = (crop["x1"], crop["y1"], crop["x2"], crop["y2"]) if crop else ()
+    return (img_path, mtime, crop_key, max_w)
+
+
+def _card_cache_get(key: tuple):
+    hit = _CARD_IMAGE_CACHE.get(key)
+    if hit is not None:
+        _CARD_IMAGE_CACHE.move_to_end(key)
+    return hit
+
+
+def _card_cache_put(key: tuple, value) -> None:
+    _CARD_IMAGE_CACHE[key] = value
+    _CARD_IMAGE_CACHE.move_to_end(key)
+    while len(_CARD_IMAGE_CACHE) > _CARD_CACHE_MAX:
+        _CARD_IMAGE_CACHE.popitem(last=False)
+
 # Background image loading so UI stays responsive
 _card_load_queue: queue.Queue = queue.Queue()
 _card_load_result_queue: queue.Queue = queue.Queue()
@@ -273,47 +331,88 @@ def _card_load_worker():
                 mtime = os.path.getmtime(img_path)
             except OSError:
                 mtime = 0
-            _card_load_result_queue.put((index, img_path, mtime, result))
+            _card_load_result_queue.put((index, img_path, mtime, max_w, result))
         except Exception:
             log.exception("Card load worker error")
 threading.Thread(target=_card_load_worker, daemon=True).start()
 
+class _DecodedImage:
+    """A screenshot decoded for card display plus its original (pre-draft) size."""
+    __slots__ = ("image", "orig_size", "__weakref__")
+
+    def __init__(self, image: Image.Image, orig_size: tuple[int, int]):
+        self.image     = image
+        self.orig_size = orig_size
+
+
+# (path, mtime) -> _DecodedImage; alive only while some card holds it (see StepCard._full_img)
+_DECODED_IMAGES: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def _card_decode_width(orig_w: int, crop_w: int, max_disp_w: int) -> int:
+    """Source width a card needs: 2x headroom over the displayed crop, never more than the file."""
+    return min(orig_w, math.ceil(2 * max_disp_w * orig_w / max(1, crop_w)))
+
+
+def _decode_card_image(img_path: str, step_index: int, max_disp_w: int) -> _DecodedImage:
+    """Decode a screenshot at the resolution a card needs (JPEG: reduced DCT decode via draft)."""
+    im = Image.open(img_path)
+    orig_w, orig_h = im.size
+    if getattr(im, "format", "") == "JPEG":
+        cx1, _, cx2, _ = _get_crop(step_index, (orig_w, orig_h))
+        want_w = _card_decode_width(orig_w, abs(cx2 - cx1), max_disp_w)
+        # Small crops of a large shot fall back to a full decode so they stay sharp
+        if want_w < orig_w:
+            try:
+                im.draft("RGB", (want_w, math.ceil(want_w * orig_h / orig_w)))
+            except Exception:
+                pass
+    return _DecodedImage(im.convert("RGB"), (orig_w, orig_h))
+
+
+def _fit_card_image(decoded: _DecodedImage, step_index: int, max_disp_w: int) -> tuple[Image.Image, tuple[int,int], tuple[int,int]]:
+    """Crop and downscale a decoded screenshot for display. Returns (resized_pil, disp_size, orig_size)."""
+    im = decoded.image
+    orig_w, orig_h = decoded.orig_size
+    w, h = im.size
+    cx1, cy1, cx2, cy2 = _get_crop(step_index, (orig_w, orig_h))
+    cx1, cx2 = sorted([cx1, cx2]); cy1, cy2 = sorted([cy1, cy2])
+    if w != orig_w or h != orig_h:
+        sx, sy = w / orig_w, h / orig_h
+        cx1 = int(cx1 * sx); cx2 = int(cx2 * sx)
+        cy1 = int(cy1 * sy); cy2 = int(cy2 * sy)
+    cx1 = max(0, min(cx1, w)); cy1 = max(0, min(cy1, h))
+    cx2 = max(cx1 + 1, min(cx2, w)); cy2 = max(cy1 + 1, min(cy2, h))
+    cw, ch = cx2 - cx1, cy2 - cy1
+    ratio = min(max_disp_w / cw, 1.0)
+    dw = max(1, int(cw * ratio))
+    dh = max(1, int(ch * ratio))
+    disp_size = (dw, dh)
+    # Crop and downscale in a single resampling pass (no intermediate cropped copy)
+    resized = im.resize((dw, dh), Image.BILINEAR, box=(cx1, cy1, cx2, cy2))
+    return (resized, disp_size, (orig_w, orig_h))
+
+
 def _load_image_fast(img_path: str, step_index: int, max_disp_w: int) -> tuple[Image.Image, tuple[int,int], tuple[int,int]] | None:
     """Load image at reduced resolution for card display. Returns (resized_pil, disp_size, orig_size) or None."""
     if not os.path.exists(img_path):
         return None
     try:
-        im = Image.open(img_path)
-        orig_w, orig_h = im.size
-        # JPEG: decode at reduced size (much faster for large screenshots)
-        if getattr(im, "format", "") == "JPEG" and (orig_w > _CARD_DECODE_MAX or orig_h > _CARD_DECODE_MAX):
-            try:
-                im.draft("RGB", (min(_CARD_DECODE_MAX, orig_w), min(_CARD_DECODE_MAX, orig_h)))
-            except Exception:
-                pass
-        im = im.convert("RGB")
-        w, h = im.size
-        cx1, cy1, cx2, cy2 = _get_crop(step_index, (orig_w, orig_h))
-        cx1, cx2 = sorted([cx1, cx2]); cy1, cy2 = sorted([cy1, cy2])
-        if w != orig_w or h != orig_h:
-            sx, sy = w / orig_w, h / orig_h
-            cx1 = int(cx1 * sx); cx2 = int(cx2 * sx)
-            cy1 = int(cy1 * sy); cy2 = int(cy2 * sy)
-        cx1 = max(0, min(cx1, w)); cy1 = max(0, min(cy1, h))
-        cx2 = max(cx1 + 1, min(cx2, w)); cy2 = max(cy1 + 1, min(cy2, h))
-        cropped = im.crop((cx1, cy1, cx2, cy2))
-        cw, ch = cropped.size
-        ratio = min(max_disp_w / cw, 1.0)
-        dw = max(1, int(cw * ratio))
-        dh = max(1, int(ch * ratio))
-        disp_size = (dw, dh)
-        resized = cropped.resize((dw, dh), Image.BILINEAR)
-        return (resized, disp_size, (orig_w, orig_h))
+        return _fit_card_image(_decode_card_image(img_path, step_index, max_disp_w), step_index, max_disp_w)
     except Exception:
         log.exception("Fast load failed for %s", img_path)
         return None
 
 
+def _purge_image_cache() -> None:
+    """Drop cached card images that belong to a different session than the current one."""
+    prefix = os.path.join(current_session, "") if current_session else None
+    for cache in (_CARD_IMAGE_CACHE, _DECODED_IMAGES):
+        for key in list(cache.keys()):
+            if prefix is None or not key[0].startswith(prefix):
+                cache.pop(key, None)
+
+
 def _load_thumbnail_fast(img_path: str, max_size: tuple[int, int]) -> Image.Image | None:
     """Load and thumbnail for list/grid cards (reduced decode for JPEG)."""
     if not os.path.exists(img_path):
@@ -332,15 +431,41 @@ def _load_thumbnail_fast(img_path: str, max_size: tuple[int, int]) -> Image.Imag
         return None
 
 
+def _thumb_photo(img_path: str, max_size: tuple[int, int]):
+    """List/grid thumbnail PhotoImage, shared through the card image cache across view switches."""
+    try:
+        mtime = os.path.getmtime(img_path)
+    except OSError:
+        return None
+    key = (img_path, mtime, "thumb", max_size)
+    photo = _card_cache_get(key)
+    if photo is None:
+        # Reuse a screenshot already decoded for an expanded card instead of reading the file again
+        decoded = _DECODED_IMAGES.get((img_path, mtime))
+        if decoded is not None:
+            im = decoded.image
+            r  = min(max_size[0] / im.width, max_size[1] / im.height, 1.0)
+            img = im.resize((max(1, int(im.width * r)), max(1, int(im.height * r))), Image.BILINEAR)
+        else:
+            img = _load_thumbnail_fast(img_path, max_size)
+        if img is None:
+            return None
+        photo = ImageTk.PhotoImage(img)
+        _card_cache_put(key, photo)
+    return photo
+
+
+_PDF_SAFE_MAP = str.maketrans({
+    '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '--', '\u2026': '...', '\u00a0': ' ',
+})
+
+
+@functools.lru_cache(maxsize=4096)
 def _pdf_safe(text: str) -> str:
-    """Make text safe for PDF built-in fonts (latin-1 subset)."""
-    replacements = {
-        '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
-        '\u2013': '-', '\u2014': '--', '\u2026': '...', '\u00a0': ' ',
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text.encode('latin-1', errors='replace').decode('latin-1')
+    """Make text safe for PDF built-in fonts (latin-1 subset). Memoized: re-exports
+    see the same descriptions again."""
+    return text.translate(_PDF_SAFE_MAP).encode('latin-1', errors='replace').decode('latin-1')
 
 
 def _open_folder(filepath: str) -> None:
@@ -357,62 +482,85 @@ def _open_folder(filepath: str) -> None:
         log.warning("Could not open folder: %s", e)
 
 
-def _flatten_to_pil(step_index: int) -> Image.Image | None:
-    """Composite crop + all vector objects onto screenshot. Returns a flat RGB PIL image, or None for text-only / missing."""
+def _flatten_to_pil(step_index: int, target: tuple[int, int] | None = None) -> Image.Image | None:
+    """Composite crop + all vector objects onto screenshot. Returns a flat RGB PIL image, or None for text-only / missing.
+    With target=(w, h) the background is downscaled to fit first and the overlays are drawn at that size."""
     entry = log_data[step_index]
     if entry.get("screenshot") is None:
         return None
     img_path = os.path.join(current_session, entry["screenshot"])
+    return _flatten_image(img_path, step_objects[step_index], step_crops[step_index],
+                          global_annotations, target)
+
+
+def _flatten_image(img_path: str, objects: list, crop: dict | None, overlay: list,
+                   target: tuple[int, int] | None = None) -> Image.Image | None:
+    """_flatten_to_pil on explicit inputs, so worker threads can render from a snapshot."""
     if not os.path.exists(img_path):
         return None
     try:
-        img = Image.open(img_path).convert("RGB")
+        img = Image.open(img_path)
     except Exception:
         return None
     orig_w, orig_h = img.size
 
     # Apply non-destructive crop
-    cx1, cy1, cx2, cy2 = _get_crop(step_index, (orig_w, orig_h))
+    cx1, cy1, cx2, cy2 = (crop["x1"], crop["y1"], crop["x2"], crop["y2"]) if crop else (0, 0, orig_w, orig_h)
     cx1, cx2 = sorted([cx1, cx2]); cy1, cy2 = sorted([cy1, cy2])
     cx1 = max(0, min(cx1, orig_w));  cy1 = max(0, min(cy1, orig_h))
     cx2 = max(cx1+1, min(cx2, orig_w)); cy2 = max(cy1+1, min(cy2, orig_h))
-    img = img.crop((cx1, cy1, cx2, cy2))
+    sc = min(target[0] / (cx2 - cx1), target[1] / (cy2 - cy1), 1.0) if target else 1.0
+    try:
+        if sc < 1.0:
+            if img.format == "JPEG":
+                img.draft("RGB", (math.ceil(orig_w * sc), math.ceil(orig_h * sc)))
+            img = img.convert("RGB")
+            dx, dy = img.width / orig_w, img.height / orig_h   # draft may have shrunk the decode
+            out_size = (max(1, int((cx2 - cx1) * sc)), max(1, int((cy2 - cy1) * sc)))
+            img = img.resize(out_size, Image.LANCZOS, box=(cx1 * dx, cy1 * dy, cx2 * dx, cy2 * dy))
+        else:
+            img = img.convert("RGB").crop((cx1, cy1, cx2, cy2))
+    except Exception:
+        return None
 
-    objects = step_objects.get(step_index, [])
-    if not objects and not global_annotations:
+    if not objects and not overlay:
         return img
 
+    hl_w = max(1, round(5 * sc))   # outline widths scale with the output
+    rd_w = max(1, round(2 * sc))
     draw_ctx = ImageDraw.Draw(img)
     for obj in objects:
         rgb = _hex_to_rgb(obj["color"])
         if obj["type"] == "highlight":
-            x1 = obj["x1"]-cx1; y1 = obj["y1"]-cy1
-            x2 = obj["x2"]-cx1; y2 = obj["y2"]-cy1
+            x1 = (obj["x1"]-cx1)*sc; y1 = (obj["y1"]-cy1)*sc
+            x2 = (obj["x2"]-cx1)*sc; y2 = (obj["y2"]-cy1)*sc
             x1,x2 = sorted([x1,x2]); y1,y2 = sorted([y1,y2])
-            for w in range(5, 0, -1):
+            for w in range(hl_w, 0, -1):
                 draw_ctx.rectangle([x1,y1,x2,y2], outline=rgb, width=w)
             ov = Image.new("RGBA", img.size, (0,0,0,0))
             ImageDraw.Draw(ov).rectangle([x1,y1,x2,y2], fill=(*rgb, 28))
             img      = Image.alpha_composite(img.convert("RGBA"), ov).convert("RGB")
             draw_ctx = ImageDraw.Draw(img)
         elif obj["type"] == "redact":
-            x1 = obj["x1"]-cx1; y1 = obj["y1"]-cy1
-            x2 = obj["x2"]-cx1; y2 = obj["y2"]-cy1
+            x1 = (obj["x1"]-cx1)*sc; y1 = (obj["y1"]-cy1)*sc
+            x2 = (obj["x2"]-cx1)*sc; y2 = (obj["y2"]-cy1)*sc
             x1,x2 = sorted([x1,x2]); y1,y2 = sorted([y1,y2])
             draw_ctx.rectangle([x1,y1,x2,y2], fill=(16,16,16))
-            draw_ctx.rectangle([x1,y1,x2,y2], outline=(70,70,70), width=2)
+            draw_ctx.rectangle([x1,y1,x2,y2], outline=(70,70,70), width=rd_w)
         elif obj["type"] == "draw":
-            pts = [(int(p[0])-cx1, int(p[1])-cy1) for p in obj["points"]]
-            w   = obj["width"]
+            pts = [(int((x - cx1) * sc), int((y - cy1) * sc)) for x, y in obj["points"]]
+            w   = max(1, round(obj["width"] * sc))
             if len(pts) >= 2:
                 draw_ctx.line(pts, fill=rgb, width=w, joint="curve")
+            # Curved joints round the interior of wide strokes, so those only need end caps;
+            # thin ones show gaps between segments without a stamp at every point
             r = w // 2
-            for x, y in pts:
+            for x, y in (pts if w <= 4 else {pts[0], pts[-1]}):
                 draw_ctx.ellipse([x-r, y-r, x+r, y+r], fill=rgb)
 
     # Global overlay (same redaction/highlight on every step, normalized coords)
     cw, ch = img.size
-    for g in global_annotations:
+    for g in overlay:
         if g.get("type") not in ("highlight", "redact"):
             continue
         x1 = int(g["x1_norm"] * cw); y1 = int(g["y1_norm"] * ch)
@@ -420,7 +568,7 @@ def _flatten_to_pil(step_index: int) -> Image.Image | None:
         x1, x2 = sorted([x1, x2]); y1, y2 = sorted([y1, y2])
         if g["type"] == "highlight":
             rgb = _hex_to_rgb(g["color"])
-            for w in range(5, 0, -1):
+            for w in range(hl_w, 0, -1):
                 draw_ctx.rectangle([x1, y1, x2, y2], outline=rgb, width=w)
             ov = Image.new("RGBA", img.size, (0, 0, 0, 0))
             ImageDraw.Draw(ov).rectangle([x1, y1, x2, y2], fill=(*rgb, 28))
@@ -428,7 +576,7 @@ def _flatten_to_pil(step_index: int) -> Image.Image | None:
             draw_ctx = ImageDraw.Draw(img)
         else:
             draw_ctx.rectangle([x1, y1, x2, y2], fill=(16, 16, 16))
-            draw_ctx.rectangle([x1, y1, x2, y2], outline=(70, 70, 70), width=2)
+            draw_ctx.rectangle([x1, y1, x2, y2], outline=(70, 70, 70), width=rd_w)
     return img
 
 
@@ -505,8 +653,8 @@ def save_steps() -> None:
     data = []
     for i, entry in enumerate(log_data):
         d = dict(entry)
-        d["objects"] = step_objects.get(i, [])
-        d["crop"]    = step_crops.get(i)
+        d["objects"] = step_objects[i]
+        d["crop"]    = step_crops[i]
         data.append(d)
     try:
         pname = project_name_var.get().strip()
@@ -532,7 +680,11 @@ def capture_screenshot(filename: str) -> str:
     base = filepath.rsplit(".", 1)[0]
     if capture_format == "png":
         out = base + ".png"
-        img.save(out, "PNG")
+        if capture_png_palette:
+            # UI screenshots rarely exceed 256 colours; palette PNGs are ~3x smaller
+            img = img.quantize(colors=256, method=Image.Quantize.MEDIANCUT,
+                               dither=Image.Dither.NONE)
+        img.save(out, "PNG", optimize=False, compress_level=3)
     else:
         out = base + ".jpg"
         img.save(out, "JPEG", quality=85)
@@ -672,7 +824,8 @@ def handle_event(event_text: str) -> None:
         "id":          str(uuid.uuid4()),
     }
     log_data.append(entry)
-    step_objects[step_counter - 1] = []
+    step_objects.append([])
+    step_crops.append(None)
     # Extract the input keyword and color-code it in the tray
     et = event_text
     if "mouse" in et:
@@ -752,21 +905,31 @@ def _on_press_key(key):
         return
 
     with _keys_lock:
-        pressed_keys.add(key)
-        mods     = [k for k in pressed_keys if k in MODIFIER_KEYS]
-        non_mods = [k for k in pressed_keys if k not in MODIFIER_KEYS]
-        if mods and non_mods:
-            combo = " + ".join([_key_str(m) for m in mods] + [_key_str(k) for k in non_mods])
+        if key in MODIFIER_KEYS:
+            _pressed_mods.add(key)
+        else:
+            _pressed_nonmods.add(key)
+        if _pressed_mods and _pressed_nonmods:
+            combo = " + ".join([_key_str(m) for m in _pressed_mods] + [_key_str(k) for k in _pressed_nonmods])
             event_queue.put(f"used keyboard shortcut {combo}")
-            pressed_keys.clear()
+            _pressed_mods.clear()
+            _pressed_nonmods.clear()
             return
-        if not mods:
+        if not _pressed_mods:
             event_queue.put(f"pressed {_key_str(key)} key")
 
 
 def _on_release_key(key):
     with _keys_lock:
-        pressed_keys.discard(key)
+        if key in MODIFIER_KEYS:
+            _pressed_mods.discard(key)
+        else:
+            _pressed_nonmods.discard(key)
+
+
+# Listener setup runs off the UI thread on one long-lived worker instead of a new thread per start
+_listener_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="psr-listeners")
+_listener_error = [None]  # set by the listener worker on failure, consumed by process_queue
 
 
 def start_listeners():
@@ -777,6 +940,17 @@ def start_listeners():
     keyboard_listener.start()
 
 
+def _on_listeners_started(future):
+    exc = future.exception()
+    if exc is not None:
+        log.error("Could not start input listeners: %s", exc, exc_info=exc)
+        _listener_error[0] = exc
+
+
+def _submit_listeners():
+    _listener_executor.submit(start_listeners).add_done_callback(_on_listeners_started)
+
+
 def stop_listeners():
     if mouse_listener and mouse_listener.is_alive():
         mouse_listener.stop()
@@ -790,6 +964,13 @@ def process_queue():
         handle_event(text)
     except queue.Empty:
         pass
+    # Listener startup failed on its worker: no clicks will be captured, so stop and say why
+    exc = _listener_error[0]
+    if exc is not None:
+        _listener_error[0] = None
+        if recording:
+            stop_recording()
+        messagebox.showerror("Recording Error", f"Could not start input capture:\n{exc}")
     # Check if F8 was pressed (pynput thread) to restore/minimize tray
     if _show_tray_flag[0]:
         _show_tray_flag[0] = False
@@ -805,24 +986,21 @@ def process_queue():
 
 def push_undo(step_index):
     """Snapshot both objects and crop for this step."""
-    if step_index not in undo_stacks:
-        undo_stacks[step_index] = []
-    undo_stacks[step_index].append(json.dumps({
-        "objects": step_objects.get(step_index, []),
-        "crop":    step_crops.get(step_index),
-    }))
+    crop = step_crops[step_index]
+    undo_stacks.setdefault(step_index, []).append((
+        [_snapshot_obj(o) for o in step_objects[step_index]],
+        dict(crop) if crop else None,
+    ))
 
 
 def pop_undo(step_index):
     stack = undo_stacks.get(step_index, [])
     if not stack:
         return False
-    state = json.loads(stack.pop())
-    step_objects[step_index] = state["objects"]
-    if state["crop"] is None:
-        step_crops.pop(step_index, None)
-    else:
-        step_crops[step_index] = state["crop"]
+    # The popped snapshot is no longer shared with the stack, so it can be adopted as-is
+    objs, crop = stack.pop()
+    step_objects[step_index] = objs
+    step_crops[step_index]   = crop
     return True
 
 
@@ -833,12 +1011,11 @@ def clear_undo_stack(step_index):
 # ══════════════════════════════════════ INSERT CUSTOM STEP ══════════════════════════════════════
 
 def _shift_step_data_up(from_index):
-    """Shift step_objects, step_crops, undo_stacks indices up by 1 from from_index."""
-    n = len(log_data)  # already includes new entry
-    for i in range(n - 1, from_index - 1, -1):
-        if i in step_objects:  step_objects[i+1]  = step_objects.pop(i)
-        if i in step_crops:    step_crops[i+1]    = step_crops.pop(i)
-        if i in undo_stacks:   undo_stacks[i+1]   = undo_stacks.pop(i)
+    """Open an empty objects/crop slot at from_index and shift undo_stacks indices up by 1."""
+    step_objects.insert(from_index, [])
+    step_crops.insert(from_index, None)
+    for i in sorted((k for k in undo_stacks if k >= from_index), reverse=True):
+        undo_stacks[i+1] = undo_stacks.pop(i)
 
 
 def insert_custom_step(after_index=None):
@@ -925,7 +1102,7 @@ def insert_custom_step(after_index=None):
     if src_full and os.path.exists(src_full):
         fname = f"step_custom_{datetime.now().strftime('%H%M%S%f')}.png"
         dst   = os.path.join(current_session, fname)
-        Image.open(src_full).convert("RGB").save(dst, "PNG")
+        _import_image_file(src_full, dst)
     else:
         fname = None
 
@@ -937,7 +1114,6 @@ def insert_custom_step(after_index=None):
         "screenshot":  fname,
         "id":          str(uuid.uuid4()),
     })
-    step_objects[insert_pos] = []
 
     global step_counter
     step_counter = len(log_data) + 1
@@ -950,6 +1126,17 @@ def insert_custom_step(after_index=None):
 _IMG_EXTS = {'.png', '.jpg', '.jpeg', '.bmp', '.webp', '.gif'}
 
 
+def _import_image_file(src: str, dst: str) -> None:
+    """Copy an image file into the session as PNG, skipping the re-encode when it already is one."""
+    if os.path.splitext(src)[1].lower() == ".png":
+        with Image.open(src) as im:   # header only — no pixel decode
+            compatible = im.format == "PNG" and im.mode in ("RGB", "RGBA")
+        if compatible:
+            shutil.copyfile(src, dst)
+            return
+    Image.open(src).convert("RGB").save(dst, "PNG", compress_level=3)
+
+
 def _insert_step_image(src, insert_pos=None, desc=None):
     """Create a step from a file path (str) or PIL Image. Returns the insert index."""
     if not current_session:
@@ -961,10 +1148,10 @@ def _insert_step_image(src, insert_pos=None, desc=None):
     dst   = os.path.join(current_session, fname)
 
     if isinstance(src, str):
-        Image.open(src).convert("RGB").save(dst, "PNG")
+        _import_image_file(src, dst)
         desc = desc or os.path.basename(src)
     else:
-        src.convert("RGB").save(dst, "PNG")
+        src.convert("RGB").save(dst, "PNG", compress_level=3)
         desc = desc or "Pasted image"
 
     _shift_step_data_up(insert_pos)
@@ -974,7 +1161,6 @@ def _insert_step_image(src, insert_pos=None, desc=None):
         "screenshot":  fname,
         "id":          str(uuid.uuid4()),
     })
-    step_objects[insert_pos] = []
 
     global step_counter
     step_counter = len(log_data) + 1
@@ -995,7 +1181,6 @@ def _insert_step_text(text, insert_pos=None):
         "screenshot":  None,
         "id":          str(uuid.uuid4()),
     })
-    step_objects[insert_pos] = []
 
     global step_counter
     step_counter = len(log_data) + 1
@@ -1012,13 +1197,29 @@ def _active_insert_pos():
     return len(log_data)
 
 
-def _handle_paste(event=None):
-    """Ctrl+V — create new step(s) from clipboard image or text."""
-    focus = root.focus_get()
-    if focus:
-        wclass = focus.winfo_class()
-        if wclass in ('Text', 'Entry', 'TEntry', 'Spinbox', 'TSpinbox'):
-            return
+# Text that merely describes an image or file (HTML, data/file URIs) should not win over it
+_CLIP_IMAGE_MARKERS = ("<img", "data:image/", "file://")
+
+
+def _clipboard_text() -> str:
+    """Plain-text clipboard contents, or "" when there is none (cheap, no bitmap decode)."""
+    try:
+        return root.clipboard_get(type="STRING")
+    except tk.TclError:
+        return ""
+
+
+def _paste_text_step(text: str, pos: int) -> str:
+    _insert_step_text(text.strip(), pos)
+    _renumber_and_rebuild(scroll_to=pos)
+    _set_status(f"✔  Pasted text as step {pos + 1}", C["success"])
+    return "break"
+
+
+def _handle_paste(event=None, prefer_image: bool = False):
+    """Ctrl+V — create new step(s) from clipboard text or image (Ctrl+Shift+V: image only)."""
+    if _focus_in_text_input():
+        return
 
     if not current_session:
         _set_status("Start or open a recording to paste into", C["warn"])
@@ -1026,6 +1227,11 @@ def _handle_paste(event=None):
 
     pos = _active_insert_pos()
 
+    # Read text first: grabclipboard() materializes any bitmap on the clipboard
+    text = "" if prefer_image else _clipboard_text()
+    if text.strip() and not any(m in text[:4000] for m in _CLIP_IMAGE_MARKERS):
+        return _paste_text_step(text, pos)
+
     try:
         clip = ImageGrab.grabclipboard()
         if clip is not None:
@@ -1047,15 +1253,8 @@ def _handle_paste(event=None):
     except Exception:
         pass
 
-    try:
-        text = root.clipboard_get()
-        if text and text.strip():
-            _insert_step_text(text.strip(), pos)
-            _renumber_and_rebuild(scroll_to=pos)
-            _set_status(f"✔  Pasted text as step {pos + 1}", C["success"])
-            return "break"
-    except Exception:
-        pass
+    if text.strip():
+        return _paste_text_step(text, pos)
 
 
 def _compute_drop_index(x_root, y_root, *, allow_after_last=True):
@@ -1201,6 +1400,20 @@ def _delete_step(idx):
     _delete_selected()
 
 
+def _unlink_session_files(names: set) -> None:
+    """Delete the given screenshot files from the session folder in one directory pass."""
+    if not names or not current_session:
+        return
+    try:
+        with os.scandir(current_session) as it:
+            for e in it:
+                if e.name in names:
+                    try: os.unlink(e.path)
+                    except OSError: pass
+    except OSError:
+        log.exception("Could not delete screenshots in %s", current_session)
+
+
 def _delete_selected():
     """Confirm and delete all steps in _selected, then rebuild."""
     global _selected
@@ -1217,27 +1430,23 @@ def _delete_selected():
         return
 
     new_log   = []
-    new_objs  = {}
-    new_crops = {}
-    new_idx   = 0
+    new_objs  = []
+    new_crops = []
+    doomed    = set()
     for old_idx in range(len(log_data)):
         if old_idx in to_delete:
             screenshot = log_data[old_idx].get("screenshot")
             if screenshot:
-                img_path = os.path.join(current_session, screenshot)
-                if os.path.exists(img_path):
-                    try: os.remove(img_path)
-                    except Exception: pass
-            clear_undo_stack(old_idx)
+                doomed.add(screenshot)
         else:
             new_log.append(log_data[old_idx])
-            if old_idx in step_objects: new_objs[new_idx]  = step_objects[old_idx]
-            if old_idx in step_crops:   new_crops[new_idx] = step_crops[old_idx]
-            new_idx += 1
+            new_objs.append(step_objects[old_idx])
+            new_crops.append(step_crops[old_idx])
 
+    _unlink_session_files(doomed)
     log_data.clear();    log_data.extend(new_log)
-    step_objects.clear(); step_objects.update(new_objs)
-    step_crops.clear();   step_crops.update(new_crops)
+    step_objects[:] = new_objs
+    step_crops[:]   = new_crops
     undo_stacks.clear()
     _selected.clear()
     _renumber_and_rebuild()
@@ -1245,18 +1454,27 @@ def _delete_selected():
     step_counter = len(log_data) + 1  # keep counter in sync for "Continue"
 
 
+_painted_sel = [None]   # selection the card borders currently show; None → repaint every card
+
+
 def _refresh_card_highlights():
-    """Update card border color to reflect current _selected set."""
-    for card in step_cards:
-        if not hasattr(card, "outer"):
+    """Update card border color to reflect current _selected set, touching only cards that changed."""
+    cur  = frozenset(_selected)
+    prev = _painted_sel[0]
+    if cur == prev:
+        return
+    changed = range(len(step_cards)) if prev is None else (cur ^ prev)
+    for i in changed:
+        if i >= len(step_cards) or not hasattr(step_cards[i], "outer"):
             continue
         try:
-            sel = card.index in _selected
-            card.outer.configure(
+            sel = i in cur
+            step_cards[i].outer.configure(
                 border_color=C["accent"] if sel else C["border"],
                 border_width=2 if sel else 1)
         except Exception:
             pass
+    _painted_sel[0] = cur
 
 
 def _apply_sidebar_selection():
@@ -1269,6 +1487,9 @@ def _apply_sidebar_selection():
 
 class BaseCard:
     """Shared interface for all card view types."""
+    _NUM_FMT = "{:02d}"   # step-number label text, per card type
+    _pending_reload = False   # reload_image was skipped while the card was off-screen
+
     def delete_selected(self): pass
     def reload_image(self):    pass
     def _refresh_undo_btn(self): pass
@@ -1276,15 +1497,37 @@ class BaseCard:
     def _delete(self):
         _delete_step(self.index)
 
+    def reindex(self, new_index):
+        """Point the card at a new step index after a reorder, without rebuilding widgets."""
+        self.index = new_index
+        self._num_label.configure(text=self._NUM_FMT.format(log_data[new_index]["step"]))
+        self._refresh_undo_btn()
+
+    def _is_visible(self):
+        """True if any part of the card lies inside the cards viewport."""
+        try:
+            canvas = cards_scroll._parent_canvas
+            cy, ch = canvas.winfo_rooty(), canvas.winfo_height()
+            wy, wh = self.outer.winfo_rooty(), self.outer.winfo_height()
+        except Exception:
+            return True
+        return wy + wh >= cy and wy <= cy + ch
+
 
 class StepCard(BaseCard):
+    _NUM_FMT = "  STEP {:02d}"
+
     def __init__(self, parent, index):
         self.index        = index
         self.is_text_only = log_data[index].get("screenshot") is None
         self._disp_size   = (CARD_IMG_MAX_W, 100)
         self._orig_size   = DEFAULT_IMG_SIZE
         self._crop_region = (0, 0, *DEFAULT_IMG_SIZE)
+        self._update_transforms()
         self._photo       = None
+        self._bg_item     = None   # canvas image item showing _photo
+        self._full_img    = None   # _DecodedImage kept once the card is edited (crop/undo reloads)
+        self._full_img_key = None  # (path, mtime) _full_img was decoded from
         self.canvas        = None
         self._folded      = _card_folded.get(_step_id(log_data[index]), False)
         self._fold_btn    = None
@@ -1293,10 +1536,18 @@ class StepCard(BaseCard):
         self._create_start = None
         self._create_rect  = None
         self._draw_pts     = []
-        self._last_draw    = None
+        self._stroke_item  = None   # single live polyline for the stroke being drawn
+        self._stroke_xy    = []     # its flat canvas coords
 
         self._selected_obj = None
         self._drag_info    = None
+        self._redraw_pending = False
+        self._obj_item_ids   = []   # canvas item ids per object, filled by _render_objects
+        self._obj_bboxes     = []   # image-space bbox per object, kept in step with _obj_item_ids
+        self._cursor         = "arrow"   # last cursor applied to the canvas
+        self.desc_box        = None
+        self._body_built     = False   # canvas + description are built on first unfold
+        self._pending_redraw = False   # crop/undo/object change arrived while there was no canvas
 
         self._build(parent)
         self._loaded = False
@@ -1311,18 +1562,31 @@ class StepCard(BaseCard):
             if self.canvas:
                 self.canvas.pack_forget()
             self.desc_box.pack_forget()
-            # Lock outer to header height so it doesn't stay full-size and block clicks
-            self.outer.update_idletasks()
-            hdr_h = self._hdr.winfo_height() if self._hdr else 42
-            self.outer.configure(height=hdr_h)
-            self.outer.pack_propagate(False)
+            self._lock_folded_height()
         else:
             # Release height lock before re-packing children
             self.outer.pack_propagate(True)
             self.outer.configure(height=0)
+            if not self._body_built:
+                self._build_body()
+                _bind_card_context(self, self.desc_box)
+                self._pending_redraw = False
+                self.reload_image()
+                self._loaded = True
+                return
             if self.canvas:
                 self.canvas.pack(fill="x")
             self.desc_box.pack(fill="x", padx=12, pady=(8, 10))
+            if self._pending_redraw:
+                self._pending_redraw = False
+                self.reload_image()
+
+    def _lock_folded_height(self):
+        """Lock outer to header height so it doesn't stay full-size and block clicks."""
+        self.outer.update_idletasks()
+        hdr_h = self._hdr.winfo_height() if self._hdr else 42
+        self.outer.configure(height=hdr_h)
+        self.outer.pack_propagate(False)
 
     # ── Build ─────────────────────────────────────────────────────────────
 
@@ -1331,19 +1595,19 @@ class StepCard(BaseCard):
             fg_color=C["card"], border_width=1, border_color=C["border"])
         self.outer.pack(fill="x", pady=(0,14), padx=2)
         self._build_header()
-        if not self.is_text_only:
-            self._build_canvas()
-        self._build_desc()
         if self._folded:
+            # Folded cards show only the header; the body is built on first unfold
             if self._fold_btn:
                 self._fold_btn.configure(text="▸")
-            if self.canvas:
-                self.canvas.pack_forget()
-            self.desc_box.pack_forget()
-            self.outer.update_idletasks()
-            hdr_h = self._hdr.winfo_height() if self._hdr else 42
-            self.outer.configure(height=hdr_h)
-            self.outer.pack_propagate(False)
+            self._lock_folded_height()
+        else:
+            self._build_body()
+
+    def _build_body(self):
+        if not self.is_text_only:
+            self._build_canvas()
+        self._build_desc()
+        self._body_built = True
 
     def _build_header(self):
         hdr = ctk.CTkFrame(self.outer, height=42, fg_color=C["surface"], corner_radius=0)
@@ -1367,7 +1631,7 @@ class StepCard(BaseCard):
 
         entry = log_data[self.index]
         self._num_label = ctk.CTkLabel(
-            hdr, text=f"  STEP {entry['step']:02d}",
+            hdr, text=self._NUM_FMT.format(entry["step"]),
             font=("Courier New", 11, "bold"), text_color=C["accent"],
             width=80, anchor="w")
         self._num_label.pack(side="left", padx=(2,0))
@@ -1415,7 +1679,8 @@ class StepCard(BaseCard):
             self._reset_crop_btn = None
 
     def _build_canvas(self):
-        self.canvas = tk.Canvas(self.outer, bg="#0d0d0d", highlightthickness=0, cursor="arrow")
+        self._cursor = "crosshair" if annotation_tool != "none" else "arrow"
+        self.canvas = tk.Canvas(self.outer, bg="#0d0d0d", highlightthickness=0, cursor=self._cursor)
         self.canvas.pack(fill="x")
         self.canvas.bind("<ButtonPress-1>",   self._on_press)
         self.canvas.bind("<B1-Motion>",       self._on_drag)
@@ -1439,6 +1704,13 @@ class StepCard(BaseCard):
     def reload_image(self):
         if self.is_text_only or not current_session:
             return
+        if self.canvas is None:
+            self._pending_redraw = True   # folded, body not built yet: _toggle_fold redraws
+            return
+        if not self._is_visible():
+            self._pending_reload = True   # picked up by _lazy_load_visible_cards
+            return
+        self._pending_reload = False
         entry    = log_data[self.index]
         img_path = os.path.join(current_session, entry["screenshot"])
         if not os.path.exists(img_path):
@@ -1448,68 +1720,74 @@ class StepCard(BaseCard):
         except Exception:
             avail_w = CARD_IMG_MAX_W
         max_w = max(CARD_IMG_MAX_W, avail_w) if avail_w > 100 else CARD_IMG_MAX_W
-        crop_tuple = step_crops.get(self.index)
-        crop_key = (crop_tuple["x1"], crop_tuple["y1"], crop_tuple["x2"], crop_tuple["y2"]) if crop_tuple else ()
         try:
             mtime = os.path.getmtime(img_path)
         except OSError:
             mtime = 0
-        cache_key = (img_path, mtime, crop_key)
-        cached = _CARD_IMAGE_CACHE.get(cache_key)
-        if cached is not None:
-            self._photo, self._disp_size, self._orig_size = cached
-            self._crop_region = _get_crop(self.index, self._orig_size)
-            cx1, cy1, cx2, cy2 = self._crop_region
-            cx1, cx2 = sorted([cx1, cx2]); cy1, cy2 = sorted([cy1, cy2])
-            self._crop_region = (cx1, cy1, cx2, cy2)
-            dw, dh = self._disp_size
-            self.canvas.configure(width=dw, height=dh)
-            self.canvas.delete("all")
-            self.canvas.create_image(0, 0, anchor="nw", image=self._photo, tags=("bg",))
-            self._render_objects()
-            return
-        result = _load_image_fast(img_path, self.index, max_w)
-        if result is None:
-            return
-        resized_pil, self._disp_size, self._orig_size = result
-        self._crop_region = _get_crop(self.index, self._orig_size)
-        cx1, cy1, cx2, cy2 = self._crop_region
-        cx1, cx2 = sorted([cx1, cx2]); cy1, cy2 = sorted([cy1, cy2])
-        self._crop_region = (cx1, cy1, cx2, cy2)
-        self._photo = ImageTk.PhotoImage(resized_pil)
-        if len(_CARD_IMAGE_CACHE) >= _CARD_CACHE_MAX:
-            # Drop oldest (arbitrary) entry
-            for k in list(_CARD_IMAGE_CACHE)[: _CARD_CACHE_MAX // 2]:
-                _CARD_IMAGE_CACHE.pop(k, None)
-        _CARD_IMAGE_CACHE[cache_key] = (self._photo, self._disp_size, self._orig_size)
-        dw, dh = self._disp_size
-        self.canvas.configure(width=dw, height=dh)
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor="nw", image=self._photo, tags=("bg",))
-        self._render_objects()
+        cache_key = _card_cache_key(self.index, img_path, mtime, max_w)
+        cached = _card_cache_get(cache_key)
+        if cached is None:
+            decoded = self._decoded_image(img_path, mtime, max_w)
+            if decoded is None:
+                return
+            resized_pil, disp_size, orig_size = _fit_card_image(decoded, self.index, max_w)
+            cached = (ImageTk.PhotoImage(resized_pil), disp_size, orig_size)
+            _card_cache_put(cache_key, cached)
+        self._show_photo(*cached)
+
+    def _decoded_image(self, img_path: str, mtime: float, max_w: int) -> _DecodedImage | None:
+        """Decoded screenshot for re-crops/resizes; the file is only re-read when its path or mtime changes
+        or a tighter crop needs more source pixels than the draft decode kept."""
+        key = (img_path, mtime)
+        decoded = self._full_img if self._full_img_key == key else None
+        if decoded is None:
+            decoded = _DECODED_IMAGES.get(key)
+        if decoded is not None:
+            orig_w = decoded.orig_size[0]
+            cx1, _, cx2, _ = _get_crop(self.index, decoded.orig_size)
+            if decoded.image.width < _card_decode_width(orig_w, abs(cx2 - cx1), max_w):
+                decoded = None
+        if decoded is None:
+            try:
+                decoded = _decode_card_image(img_path, self.index, max_w)
+            except Exception:
+                log.exception("Decode failed for %s", img_path)
+                return None
+            _DECODED_IMAGES[key] = decoded
+        self._full_img, self._full_img_key = decoded, key
+        return decoded
 
     def _apply_loaded_image(self, resized_pil: Image.Image, disp_size: tuple[int,int], orig_size: tuple[int,int]) -> None:
         """Apply a pre-loaded image (from background thread). Call from main thread only."""
-        self._orig_size = orig_size
-        self._crop_region = _get_crop(self.index, orig_size)
-        cx1, cy1, cx2, cy2 = self._crop_region
+        self._show_photo(ImageTk.PhotoImage(resized_pil), disp_size, orig_size)
+
+    def _show_photo(self, photo, disp_size: tuple[int,int], orig_size: tuple[int,int]) -> None:
+        """Put a display-ready background image on the canvas and redraw the overlays."""
+        self._photo, self._disp_size, self._orig_size = photo, disp_size, orig_size
+        cx1, cy1, cx2, cy2 = _get_crop(self.index, orig_size)
         cx1, cx2 = sorted([cx1, cx2]); cy1, cy2 = sorted([cy1, cy2])
         self._crop_region = (cx1, cy1, cx2, cy2)
-        self._disp_size = disp_size
-        self._photo = ImageTk.PhotoImage(resized_pil)
+        self._update_transforms()
         dw, dh = disp_size
         self.canvas.configure(width=dw, height=dh)
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor="nw", image=self._photo, tags=("bg",))
-        self._render_objects()
+        _card_geom_cache.clear()   # the card's height may have changed under a drag in progress
+        # One persistent background item; swapping its image keeps the canvas item table stable
+        if self._bg_item is None:
+            self._bg_item = self.canvas.create_image(0, 0, anchor="nw", image=self._photo, tags=("bg",))
+        else:
+            self.canvas.itemconfigure(self._bg_item, image=self._photo)
+        self._render_objects()   # clears every "obj" item, incl. rubber-band/stroke leftovers
 
     def _render_objects(self):
+        if self.canvas is None:
+            self._pending_redraw = True
+            return
         self.canvas.delete("obj")
-        objects = step_objects.get(self.index, [])
-        for i, obj in enumerate(objects):
-            self._render_one(i, obj)
+        objects = step_objects[self.index]
+        bboxes = self._obj_bboxes = [_obj_bbox_img(obj) for obj in objects]
+        self._obj_item_ids = [self._render_one(i, obj, bboxes[i]) for i, obj in enumerate(objects)]
         if self._selected_obj is not None and self._selected_obj < len(objects):
-            self._draw_gizmo(objects[self._selected_obj])
+            self._draw_gizmo(bboxes[self._selected_obj])
         # Global overlay (normalized 0–1 → canvas)
         dw, dh = self._disp_size
         for g in global_annotations:
@@ -1527,40 +1805,68 @@ class StepCard(BaseCard):
                 self.canvas.create_rectangle(x1c, y1c, x2c, y2c,
                     outline="#555555", width=1, fill="#0a0a0a", tags=tag)
 
-    def _render_one(self, i, obj):
+    def _render_one(self, i, obj, bbox):
+        """Create the canvas items for one object (bbox = its image-space bbox) and return their ids."""
         tag = ("obj", f"obj_{i}")
         if obj["type"] == "highlight":
-            x1c, y1c, x2c, y2c = self._img_bbox_to_canvas(_obj_bbox_img(obj))
-            self.canvas.create_rectangle(x1c, y1c, x2c, y2c,
-                outline=obj["color"], width=3, fill="", tags=tag)
-            self.canvas.create_rectangle(x1c+2, y1c+2, x2c-2, y2c-2,
-                outline="", fill=obj["color"], stipple="gray12", tags=tag)
+            x1c, y1c, x2c, y2c = self._img_bbox_to_canvas(bbox)
+            return (
+                self.canvas.create_rectangle(x1c, y1c, x2c, y2c,
+                    outline=obj["color"], width=3, fill="", tags=tag),
+                self.canvas.create_rectangle(x1c+2, y1c+2, x2c-2, y2c-2,
+                    outline="", fill=obj["color"], stipple="gray12", tags=tag),
+            )
         elif obj["type"] == "redact":
-            x1c, y1c, x2c, y2c = self._img_bbox_to_canvas(_obj_bbox_img(obj))
-            self.canvas.create_rectangle(x1c, y1c, x2c, y2c,
-                outline="#555555", width=1, fill="#0a0a0a", tags=tag)
+            x1c, y1c, x2c, y2c = self._img_bbox_to_canvas(bbox)
+            return (self.canvas.create_rectangle(x1c, y1c, x2c, y2c,
+                outline="#555555", width=1, fill="#0a0a0a", tags=tag),)
         elif obj["type"] == "draw":
             if not obj["points"]:
-                return
-            dw, _  = self._disp_size
-            cx1, cy1, cx2, cy2 = self._crop_region
-            crop_w = cx2 - cx1
-            scale  = dw / crop_w
-            pts_c  = [(int((p[0]-cx1)*scale), int((p[1]-cy1)*scale))
-                      for p in obj["points"]]
-            wc = max(1, int(obj["width"] * scale))
-            if len(pts_c) >= 2:
-                flat = [c for pt in pts_c for c in pt]
-                self.canvas.create_line(*flat, fill=obj["color"], width=wc,
-                    capstyle=tk.ROUND, smooth=True, joinstyle=tk.ROUND, tags=tag)
+                return ()
+            flat, wc = self._stroke_to_canvas(obj)
+            ids = []
+            if len(flat) >= 4:
+                ids.append(self.canvas.create_line(*flat, fill=obj["color"], width=wc,
+                    capstyle=tk.ROUND, smooth=True, joinstyle=tk.ROUND, tags=tag))
             r = max(1, wc//2)
-            self.canvas.create_oval(
-                pts_c[0][0]-r, pts_c[0][1]-r,
-                pts_c[0][0]+r, pts_c[0][1]+r,
-                fill=obj["color"], outline="", tags=tag)
+            ids.append(self.canvas.create_oval(
+                flat[0]-r, flat[1]-r, flat[0]+r, flat[1]+r,
+                fill=obj["color"], outline="", tags=tag))
+            return tuple(ids)
+        return ()
+
+    def _stroke_to_canvas(self, obj):
+        """Flat canvas coords [x0, y0, x1, y1, ...] and canvas line width for a draw object."""
+        cx1, cy1 = self._crop_x1, self._crop_y1
+        scale    = self._sx_i2c
+        pts      = obj["points"]
+        # Column-wise: one tight comprehension per axis, interleaved by slice assignment
+        flat = [0] * (2 * len(pts))
+        flat[0::2] = [int((x - cx1) * scale) for x, _ in pts]
+        flat[1::2] = [int((y - cy1) * scale) for _, y in pts]
+        return flat, max(1, int(obj["width"] * scale))
+
+    def _update_obj_items(self, i):
+        """Move object i's existing canvas items in place (drag path) and redraw only the gizmo."""
+        obj = step_objects[self.index][i]
+        ids = self._obj_item_ids[i]
+        bbox = self._obj_bboxes[i] = _obj_bbox_img(obj)
+        if obj["type"] in ("highlight", "redact"):
+            x1c, y1c, x2c, y2c = self._img_bbox_to_canvas(bbox)
+            self.canvas.coords(ids[0], x1c, y1c, x2c, y2c)
+            if len(ids) > 1:
+                self.canvas.coords(ids[1], x1c+2, y1c+2, x2c-2, y2c-2)
+        elif obj["type"] == "draw" and ids:
+            flat, wc = self._stroke_to_canvas(obj)
+            if len(ids) > 1:
+                self.canvas.coords(ids[0], *flat)
+            r = max(1, wc//2)
+            self.canvas.coords(ids[-1], flat[0]-r, flat[1]-r, flat[0]+r, flat[1]+r)
+        self.canvas.delete("gizmo")
+        self._draw_gizmo(bbox)
 
-    def _draw_gizmo(self, obj):
-        bx1, by1, bx2, by2 = self._img_bbox_to_canvas(_obj_bbox_img(obj))
+    def _draw_gizmo(self, bbox):
+        bx1, by1, bx2, by2 = self._img_bbox_to_canvas(bbox)
         self.canvas.create_rectangle(bx1-2, by1-2, bx2+2, by2+2,
             outline="#ffffff", width=1, dash=(5,3), tags=("obj","gizmo"))
         mx = (bx1+bx2)/2; my = (by1+by2)/2
@@ -1577,34 +1883,41 @@ class StepCard(BaseCard):
 
     # ── Coordinate helpers (crop-aware) ───────────────────────────────────
 
-    def _canvas_to_img(self, cx, cy):
-        """Canvas pixel -> original image pixel, accounting for crop offset."""
+    def _update_transforms(self):
+        """Cache crop origin and canvas<->image scales; call whenever _crop_region or _disp_size changes."""
         dw, dh = self._disp_size
         rx1, ry1, rx2, ry2 = self._crop_region
-        cw = rx2 - rx1; ch = ry2 - ry1
-        return max(0, int(rx1 + cx * cw / dw)), max(0, int(ry1 + cy * ch / dh))
+        cw = (rx2 - rx1) or 1; ch = (ry2 - ry1) or 1
+        self._crop_x1, self._crop_y1 = rx1, ry1
+        self._sx_i2c, self._sy_i2c = dw / cw, dh / ch
+        self._sx_c2i, self._sy_c2i = cw / dw, ch / dh
+
+    def _canvas_to_img(self, cx, cy):
+        """Canvas pixel -> original image pixel, accounting for crop offset."""
+        return (max(0, int(self._crop_x1 + cx * self._sx_c2i)),
+                max(0, int(self._crop_y1 + cy * self._sy_c2i)))
 
     def _img_to_canvas(self, ix, iy):
         """Original image pixel -> canvas pixel, accounting for crop offset."""
-        dw, dh = self._disp_size
-        rx1, ry1, rx2, ry2 = self._crop_region
-        cw = rx2 - rx1; ch = ry2 - ry1
-        return int((ix - rx1) * dw / cw), int((iy - ry1) * dh / ch)
+        return int((ix - self._crop_x1) * self._sx_i2c), int((iy - self._crop_y1) * self._sy_i2c)
 
     def _img_bbox_to_canvas(self, bbox):
         x1, y1, x2, y2 = bbox
-        return (*self._img_to_canvas(x1, y1), *self._img_to_canvas(x2, y2))
+        ox, oy = self._crop_x1, self._crop_y1
+        sx, sy = self._sx_i2c, self._sy_i2c
+        return int((x1 - ox) * sx), int((y1 - oy) * sy), int((x2 - ox) * sx), int((y2 - oy) * sy)
 
     # ── Hit testing ───────────────────────────────────────────────────────
 
     def _handle_at(self, cx, cy):
         if self._selected_obj is None:
             return None
-        objects = step_objects.get(self.index, [])
-        if self._selected_obj >= len(objects):
+        objects = step_objects[self.index]
+        sel = self._selected_obj
+        if sel >= len(objects):
             return None
-        bx1, by1, bx2, by2 = self._img_bbox_to_canvas(
-            _obj_bbox_img(objects[self._selected_obj]))
+        bbox = self._obj_bboxes[sel] if len(self._obj_bboxes) == len(objects) else _obj_bbox_img(objects[sel])
+        bx1, by1, bx2, by2 = self._img_bbox_to_canvas(bbox)
         mx = (bx1+bx2)/2; my = (by1+by2)/2
         positions = [
             (bx1,by1),(mx,by1),(bx2,by1),
@@ -1618,10 +1931,14 @@ class StepCard(BaseCard):
 
     def _obj_at(self, cx, cy):
         ix, iy  = self._canvas_to_img(cx, cy)
-        objects = step_objects.get(self.index, [])
+        objects = step_objects[self.index]
+        # Bounding boxes are cached by _render_objects — strokes would otherwise be rescanned per motion
+        bboxes  = self._obj_bboxes
+        if len(bboxes) != len(objects):
+            bboxes = self._obj_bboxes = [_obj_bbox_img(obj) for obj in objects]
         PAD     = 6
-        for i in range(len(objects)-1, -1, -1):
-            x1, y1, x2, y2 = _obj_bbox_img(objects[i])
+        for i in range(len(bboxes)-1, -1, -1):
+            x1, y1, x2, y2 = bboxes[i]
             if (x1-PAD)<=ix<=(x2+PAD) and (y1-PAD)<=iy<=(y2+PAD):
                 return i
         return None
@@ -1634,26 +1951,26 @@ class StepCard(BaseCard):
         if annotation_tool == "none":
             handle = self._handle_at(event.x, event.y)
             if handle is not None:
-                objects = step_objects.get(self.index, [])
+                objects = step_objects[self.index]
                 obj     = objects[self._selected_obj]
                 push_undo(self.index)
                 self._drag_info = {
                     "type": "handle", "handle": handle,
                     "start_canvas": (event.x, event.y),
-                    "obj_snapshot": copy.deepcopy(obj),
+                    "obj_snapshot": _snapshot_obj(obj),
                     "bbox_start":   _obj_bbox_img(obj),
                 }
                 return
             hit = self._obj_at(event.x, event.y)
             if hit is not None:
                 self._selected_obj = hit
-                objects = step_objects.get(self.index, [])
+                objects = step_objects[self.index]
                 push_undo(self.index)
                 self._drag_info = {
                     "type": "move",
                     "start_canvas": (event.x, event.y),
                     "start_img":    self._canvas_to_img(event.x, event.y),
-                    "obj_snapshot": copy.deepcopy(objects[hit]),
+                    "obj_snapshot": _snapshot_obj(objects[hit]),
                 }
                 self._render_objects()
                 self._update_color_swatches_for_selection()
@@ -1668,7 +1985,11 @@ class StepCard(BaseCard):
         if annotation_tool == "draw":
             push_undo(self.index)
             self._draw_pts  = [(event.x, event.y)]
-            self._last_draw = (event.x, event.y)
+            self._stroke_xy = [event.x, event.y, event.x, event.y]
+            wc    = max(1, int(draw_width * self._disp_size[0] / self._orig_size[0]))
+            self._stroke_item = self.canvas.create_line(
+                *self._stroke_xy, fill=draw_color, width=wc,
+                capstyle=tk.ROUND, smooth=True, tags=("obj",))
             return
 
         self._create_start = (event.x, event.y)
@@ -1680,19 +2001,12 @@ class StepCard(BaseCard):
             kw = dict(outline=C["crop_col"], width=2, fill="", dash=(8,4))
         self._create_rect = self.canvas.create_rectangle(
             event.x, event.y, event.x, event.y, **kw, tags=("obj",))
-        if annotation_tool in ("highlight", "redact"):
-            push_undo(self.index)
 
     def _on_drag(self, event):
-        if annotation_tool == "draw" and self._last_draw:
-            dw, _ = self._disp_size
-            ow, _ = self._orig_size
-            wc    = max(1, int(draw_width * dw / ow))
-            self.canvas.create_line(
-                self._last_draw[0], self._last_draw[1], event.x, event.y,
-                fill=draw_color, width=wc, capstyle=tk.ROUND, smooth=True, tags=("obj",))
+        if annotation_tool == "draw" and self._stroke_item:
             self._draw_pts.append((event.x, event.y))
-            self._last_draw = (event.x, event.y)
+            self._stroke_xy += (event.x, event.y)
+            self.canvas.coords(self._stroke_item, *self._stroke_xy)
             return
 
         if self._create_rect and self._create_start:
@@ -1702,7 +2016,7 @@ class StepCard(BaseCard):
 
         if not self._drag_info:
             return
-        objects = step_objects.get(self.index, [])
+        objects = step_objects[self.index]
         if self._selected_obj is None or self._selected_obj >= len(objects):
             return
         obj  = objects[self._selected_obj]
@@ -1738,7 +2052,24 @@ class StepCard(BaseCard):
                     [nx1+(p[0]-bx1)*(nx2-nx1)/ow, ny1+(p[1]-by1)*(ny2-ny1)/oh]
                     for p in snap["points"]
                 ]
-        self._render_objects()
+        self._schedule_render()
+
+    def _schedule_render(self):
+        """Coalesce overlay redraws to one per idle cycle (motion events arrive faster than frames)."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.canvas.after_idle(self._do_render)
+
+    def _do_render(self):
+        self._redraw_pending = False
+        try:
+            i = self._selected_obj
+            if self._drag_info is not None and i is not None and i < len(self._obj_item_ids):
+                self._update_obj_items(i)
+            else:
+                self._render_objects()
+        except tk.TclError:
+            pass   # card was destroyed before the idle callback ran
 
     def _on_release(self, event):
         # Finalize draw stroke
@@ -1746,12 +2077,13 @@ class StepCard(BaseCard):
             if not self._draw_pts:
                 return
             img_pts = [list(self._canvas_to_img(cx, cy)) for cx, cy in self._draw_pts]
-            step_objects.setdefault(self.index, []).append(
+            step_objects[self.index].append(
                 {"type": "draw", "color": draw_color, "width": draw_width, "points": img_pts})
-            self._draw_pts  = []
-            self._last_draw = None
+            self._draw_pts    = []
+            self._stroke_xy   = []
+            self._stroke_item = None
             save_steps()
-            self.reload_image()
+            self._render_objects()   # background is unchanged — only the overlay layer
             self._refresh_undo_btn()
             return
 
@@ -1759,6 +2091,7 @@ class StepCard(BaseCard):
         if annotation_tool == "crop" and self._create_start:
             x1, y1 = self._create_start
             x2, y2 = event.x, event.y
+            rubber = self._create_rect
             self._create_rect  = None
             self._create_start = None
             ix1,iy1 = self._canvas_to_img(x1, y1)
@@ -1770,27 +2103,31 @@ class StepCard(BaseCard):
                 save_steps()
                 self.reload_image()
                 self._refresh_undo_btn()
-            else:
-                self.reload_image()
+            elif rubber:
+                self.canvas.delete(rubber)
             return
 
         # Rect annotations
         if annotation_tool in ("highlight", "redact") and self._create_start:
             x1,y1 = self._create_start
             x2,y2 = event.x, event.y
+            rubber = self._create_rect
             self._create_rect  = None
             self._create_start = None
             ix1,iy1 = self._canvas_to_img(x1,y1)
             ix2,iy2 = self._canvas_to_img(x2,y2)
             if abs(ix2-ix1)>4 and abs(iy2-iy1)>4:
-                step_objects.setdefault(self.index, []).append({
+                push_undo(self.index)   # only once the rectangle is accepted
+                step_objects[self.index].append({
                     "type": annotation_tool, "color": draw_color, "width": 3,
                     "x1": min(ix1,ix2), "y1": min(iy1,iy2),
                     "x2": max(ix1,ix2), "y2": max(iy1,iy2)
                 })
-            save_steps()
-            self.reload_image()
-            self._refresh_undo_btn()
+                save_steps()
+                self._render_objects()
+                self._refresh_undo_btn()
+            elif rubber:
+                self.canvas.delete(rubber)
             return
 
         # Finalize transform
@@ -1804,15 +2141,21 @@ class StepCard(BaseCard):
         if annotation_tool != "none":
             return
         if self._handle_at(event.x, event.y) is not None:
-            self.canvas.configure(cursor="sizing")
+            self._set_cursor("sizing")
         elif self._obj_at(event.x, event.y) is not None:
-            self.canvas.configure(cursor="fleur")
+            self._set_cursor("fleur")
         else:
-            self.canvas.configure(cursor="arrow")
+            self._set_cursor("arrow")
+
+    def _set_cursor(self, cursor):
+        """Configure the canvas cursor only on actual transitions (hover fires per pixel)."""
+        if cursor != self._cursor:
+            self._cursor = cursor
+            self.canvas.configure(cursor=cursor)
 
     def _add_selection_to_global(self):
         """Add the currently selected highlight/redact to global overlay (all steps)."""
-        objects = step_objects.get(self.index, [])
+        objects = step_objects[self.index]
         if self._selected_obj is None or self._selected_obj >= len(objects):
             return
         obj = objects[self._selected_obj]
@@ -1849,7 +2192,7 @@ class StepCard(BaseCard):
                        activebackground=C["accent"], activeforeground="#fff",
                        font=("Segoe UI", 10))
         if self._selected_obj is not None:
-            objects = step_objects.get(self.index, [])
+            objects = step_objects[self.index]
             if self._selected_obj < len(objects):
                 obj = objects[self._selected_obj]
                 label = obj["type"].capitalize()
@@ -1866,7 +2209,7 @@ class StepCard(BaseCard):
                             command=lambda c=hex_col: self.apply_color_to_selection(c))
                     menu.add_cascade(label="Colour", menu=color_sub)
                 menu.add_separator()
-        if self.index in step_crops:
+        if step_crops[self.index] is not None:
             menu.add_command(label="Apply crop (permanent)", command=self._apply_crop)
             menu.add_command(label="Clear crop", command=self._reset_crop)
             menu.add_separator()
@@ -1888,7 +2231,10 @@ class StepCard(BaseCard):
 
     def _show_fullscreen(self):
         """Open a maximized top-level window showing the full annotated image."""
-        flat = _flatten_to_pil(self.index)
+        sw = root.winfo_screenwidth()
+        sh = root.winfo_screenheight()
+        # Flatten straight at screen size — overlays are composited on the small image
+        flat = _flatten_to_pil(self.index, target=(sw, sh))
         if flat is None:
             return
         win = tk.Toplevel(root)
@@ -1897,13 +2243,7 @@ class StepCard(BaseCard):
         win.attributes("-topmost", True)
         win.state("zoomed")
 
-        sw = win.winfo_screenwidth()
-        sh = win.winfo_screenheight()
-        ratio = min(sw / flat.width, sh / flat.height, 1.0)
-        dw = int(flat.width * ratio)
-        dh = int(flat.height * ratio)
-        resized = flat.resize((dw, dh), Image.LANCZOS)
-        photo = ImageTk.PhotoImage(resized)
+        photo = ImageTk.PhotoImage(flat)
 
         canvas = tk.Canvas(win, bg="#111111", highlightthickness=0)
         canvas.pack(fill="both", expand=True)
@@ -1919,7 +2259,7 @@ class StepCard(BaseCard):
     def _update_color_swatches_for_selection(self):
         if self._selected_obj is None:
             return
-        objects = step_objects.get(self.index, [])
+        objects = step_objects[self.index]
         if self._selected_obj >= len(objects):
             return
         col = objects[self._selected_obj].get("color", draw_color)
@@ -1927,7 +2267,7 @@ class StepCard(BaseCard):
         _set_status("Object selected — click a colour swatch to repaint it", C["accent"])
 
     def apply_color_to_selection(self, hex_color):
-        objects = step_objects.get(self.index, [])
+        objects = step_objects[self.index]
         if self._selected_obj is None or self._selected_obj >= len(objects):
             return False
         push_undo(self.index)
@@ -1938,7 +2278,7 @@ class StepCard(BaseCard):
         return True
 
     def delete_selected(self):
-        objects = step_objects.get(self.index, [])
+        objects = step_objects[self.index]
         if self._selected_obj is None or self._selected_obj >= len(objects):
             return
         push_undo(self.index)
@@ -1953,22 +2293,27 @@ class StepCard(BaseCard):
     # ── Card actions ──────────────────────────────────────────────────────
 
     def _undo(self):
+        crop_before = step_crops[self.index]
         if pop_undo(self.index):
             self._selected_obj = None
             self._drag_info    = None
             save_steps()
-            self.reload_image()
+            # Only a crop change needs a new background; annotation undo is overlay-only
+            if step_crops[self.index] != crop_before:
+                self.reload_image()
+            else:
+                self._render_objects()
             self._refresh_undo_btn()
             _set_status("↩  Undo applied", C["warn"])
         else:
             _set_status("Nothing to undo for this step", C["muted"])
 
     def _reset_crop(self):
-        if self.index not in step_crops:
+        if step_crops[self.index] is None:
             _set_status("No crop to reset on this step", C["muted"])
             return
         push_undo(self.index)
-        step_crops.pop(self.index, None)
+        step_crops[self.index] = None
         save_steps()
         self.reload_image()
         self._refresh_undo_btn()
@@ -1976,7 +2321,7 @@ class StepCard(BaseCard):
 
     def _apply_crop(self):
         """Permanently crop the screenshot to the current crop region and clear the crop."""
-        if self.index not in step_crops or not current_session:
+        if step_crops[self.index] is None or not current_session:
             _set_status("No crop to apply on this step", C["muted"])
             return
         entry = log_data[self.index]
@@ -2005,7 +2350,7 @@ class StepCard(BaseCard):
             return
         # Translate annotations to new origin (crop becomes 0,0)
         new_w, new_h = x2 - x1, y2 - y1
-        objs = step_objects.get(self.index, [])
+        objs = step_objects[self.index]
         new_objs = []
         for obj in objs:
             if obj["type"] in ("highlight", "redact"):
@@ -2022,7 +2367,7 @@ class StepCard(BaseCard):
                 if pts:
                     new_objs.append({**obj, "points": pts})
         step_objects[self.index] = new_objs
-        step_crops.pop(self.index, None)
+        step_crops[self.index] = None
         save_steps()
         self.reload_image()
         self._refresh_undo_btn()
@@ -2046,16 +2391,17 @@ class StepCard(BaseCard):
             text_color=C["text"] if has else C["muted"],
             state="normal" if has else "disabled")
         if self._reset_crop_btn is not None:
-            has_crop = self.index in step_crops
+            has_crop = step_crops[self.index] is not None
             self._reset_crop_btn.configure(
                 text_color=C["text"] if has_crop else C["muted"],
                 state="normal" if has_crop else "disabled")
 
     def update_header(self):
         entry = log_data[self.index]
-        self._num_label.configure(text=f"  STEP {entry['step']:02d}")
-        self.desc_box.delete("1.0", "end")
-        self.desc_box.insert("end", entry["description"])
+        self._num_label.configure(text=self._NUM_FMT.format(entry["step"]))
+        if self.desc_box is not None:
+            self.desc_box.delete("1.0", "end")
+            self.desc_box.insert("end", entry["description"])
         self._refresh_undo_btn()
 
 
@@ -2066,6 +2412,7 @@ LIST_THUMB_W = 180
 
 class ListCard(BaseCard):
     """Compact row: small thumbnail on the left, description on the right."""
+    _NUM_FMT = "{:02d}"
 
     def __init__(self, parent, index):
         self.index        = index
@@ -2075,6 +2422,7 @@ class ListCard(BaseCard):
         self._selected_obj = None
         self._undo_btn     = None
         self._reset_crop_btn = None
+        self._loaded       = self.is_text_only   # thumbnail loads once scrolled into view
 
         self.outer = ctk.CTkFrame(parent, corner_radius=6,
             fg_color=C["card"], border_width=1, border_color=C["border"], height=80)
@@ -2090,7 +2438,7 @@ class ListCard(BaseCard):
 
         entry = log_data[index]
         self._num_label = ctk.CTkLabel(self.outer,
-            text=f"{entry['step']:02d}", font=("Courier New", 10, "bold"),
+            text=self._NUM_FMT.format(entry["step"]), font=("Courier New", 10, "bold"),
             text_color=C["accent"], width=26)
         self._num_label.pack(side="left", padx=(2,4))
 
@@ -2098,7 +2446,6 @@ class ListCard(BaseCard):
             self._thumb_label = ctk.CTkLabel(self.outer, text="",
                 width=LIST_THUMB_W, height=68, corner_radius=4, fg_color="#0d0d0d")
             self._thumb_label.pack(side="left", padx=(0,8), pady=6)
-            self._load_thumb()
         else:
             ctk.CTkLabel(self.outer, text="[note]", font=("Segoe UI", 9),
                          text_color=C["muted"], width=LIST_THUMB_W
@@ -2125,10 +2472,10 @@ class ListCard(BaseCard):
         if entry.get("screenshot") is None:
             return
         img_path = os.path.join(current_session, entry["screenshot"])
-        img = _load_thumbnail_fast(img_path, (LIST_THUMB_W, 68))
-        if img is not None:
-            self._photo = ImageTk.PhotoImage(img)
-            self._thumb_label.configure(image=self._photo)
+        photo = _thumb_photo(img_path, (LIST_THUMB_W, 68))
+        if photo is not None:
+            self._photo = photo
+            self._thumb_label.configure(image=photo)
 
 
 # ══════════════════════════════════════ GRID CARD ══════════════════════════════════════
@@ -2138,6 +2485,7 @@ GRID_TILE_W = 260
 
 class GridCard(BaseCard):
     """Square-ish tile for grid layout."""
+    _NUM_FMT = "STEP {:02d}"
 
     def __init__(self, parent, index):
         self.index        = index
@@ -2147,6 +2495,7 @@ class GridCard(BaseCard):
         self._selected_obj = None
         self._undo_btn     = None
         self._reset_crop_btn = None
+        self._loaded       = self.is_text_only   # thumbnail loads once scrolled into view
 
         self.outer = ctk.CTkFrame(parent, corner_radius=6,
             fg_color=C["card"], border_width=1, border_color=C["border"],
@@ -2166,7 +2515,7 @@ class GridCard(BaseCard):
         grip.bind("<ButtonRelease-1>", _card_drag_release)
 
         self._num_label = ctk.CTkLabel(hdr,
-            text=f"STEP {entry['step']:02d}", font=("Courier New", 9, "bold"),
+            text=self._NUM_FMT.format(entry["step"]), font=("Courier New", 9, "bold"),
             text_color=C["accent"])
         self._num_label.pack(side="left", padx=4)
 
@@ -2179,7 +2528,6 @@ class GridCard(BaseCard):
             self._thumb_label = ctk.CTkLabel(self.outer, text="",
                 width=GRID_TILE_W-4, height=150, corner_radius=0, fg_color="#0d0d0d")
             self._thumb_label.pack(padx=2, pady=(2,0))
-            self._load_thumb()
 
         self.desc_box = ctk.CTkTextbox(
             self.outer, height=48, font=("Segoe UI", 9),
@@ -2197,15 +2545,19 @@ class GridCard(BaseCard):
         if entry.get("screenshot") is None:
             return
         img_path = os.path.join(current_session, entry["screenshot"])
-        img = _load_thumbnail_fast(img_path, (GRID_TILE_W - 4, 150))
-        if img is not None:
-            self._photo = ImageTk.PhotoImage(img)
-            self._thumb_label.configure(image=self._photo)
+        photo = _thumb_photo(img_path, (GRID_TILE_W - 4, 150))
+        if photo is not None:
+            self._photo = photo
+            self._thumb_label.configure(image=photo)
 
 
 # ══════════════════════════════════════ CARD MANAGEMENT ══════════════════════════════════════
 
 def _clear_cards():
+    if _card_build["after"] is not None:
+        root.after_cancel(_card_build["after"])
+        _card_build["after"] = None
+    _painted_sel[0] = None
     _card_drag_cleanup()
     active_card_ref[0] = None
     _card_load_pending.clear()
@@ -2216,6 +2568,7 @@ def _clear_cards():
     for child in list(cards_scroll.winfo_children()):
         try: child.destroy()
         except Exception: pass
+    _purge_image_cache()
 
 
 def _refresh_ui_state():
@@ -2232,48 +2585,106 @@ def _refresh_ui_state():
         btn_continue.configure(state="normal" if has_session else "disabled")
 
 
+_rebuild_after = [None]   # pending after_idle id from _schedule_build_all_cards
+
+
+def _schedule_build_all_cards():
+    """Rebuild all cards once the event loop is idle; repeated requests in one tick collapse."""
+    if _rebuild_after[0] is None:
+        _rebuild_after[0] = root.after_idle(_build_all_cards)
+
+
 def _build_all_cards():
+    if _rebuild_after[0] is not None:
+        root.after_cancel(_rebuild_after[0])
+        _rebuild_after[0] = None
     _clear_cards()
     if not log_data:
         # Empty state — centred hint inside the scroll area
-        _ph = ctk.CTkFrame(cards_scroll, fg_color="transparent")
+        _ph = tk.Frame(cards_scroll, bg=C["bg"], height=200)
         _ph.pack(fill="both", expand=True)
         _ph.pack_propagate(False)
         _empty_hint = ("No steps yet.\n\n"
             "⏩  Continue to resume recording into this session\n"
             "＋  Step to add a blank step manually\n"
             "or drop images directly into this area.")
-        ctk.CTkLabel(_ph, text=_empty_hint,
-            font=("Segoe UI", 11), text_color=C["muted"], justify="center",
+        tk.Label(_ph, text=_empty_hint, bg=C["bg"], fg=C["muted"],
+            font=("Segoe UI", 11), justify="center",
         ).place(relx=0.5, rely=0.4, anchor="center")
-    elif view_mode == "grid":
-        _grid_frame = ctk.CTkFrame(cards_scroll, fg_color="transparent")
-        _grid_frame.pack(fill="x", anchor="nw")
-        cols = max(1, (cards_scroll._parent_canvas.winfo_width() - 20) // (GRID_TILE_W + 12))
-        for i in range(len(log_data)):
-            card = GridCard(_grid_frame, i)
-            r, c = divmod(i, cols)
-            card.outer.grid(row=r, column=c, padx=6, pady=6, sticky="n")
-            step_cards.append(card)
-    elif view_mode == "list":
-        for i in range(len(log_data)):
-            step_cards.append(ListCard(cards_scroll, i))
     else:
-        for i in range(len(log_data)):
-            step_cards.append(StepCard(cards_scroll, i))
+        if view_mode == "grid":
+            _grid_frame = tk.Frame(cards_scroll, bg=C["bg"])
+            _grid_frame.pack(fill="x", anchor="nw")
+            _card_build["grid"] = _grid_frame
+            _card_build["rows"] = []
+            _card_build["cols"] = max(1, (cards_scroll._parent_canvas.winfo_width() - 20) // (GRID_TILE_W + 12))
+        # First screenful now; the rest is built in idle-time batches
+        _build_cards_batch()
     _refresh_sidebar()
     _refresh_ui_state()
-    root.after(30, _reset_cards_scroll)
-    root.after(50, _refresh_card_highlights)
+    root.after_idle(_post_build)
     root.after(80, _lazy_load_visible_cards)
 
 
+def _post_build():
+    """Once the new cards are laid out: fix the scroll region, then paint selection borders."""
+    _reset_cards_scroll()
+    _refresh_card_highlights()
+
+
+_CARD_BATCH = 12   # cards created per batch; the first batch covers the initial viewport
+_card_build = {"after": None, "grid": None, "rows": [], "cols": 1}
+_GRID_PACK = dict(side="left", padx=6, pady=6, anchor="n")
+
+
+def _grid_row(r):
+    """Row frame r of the grid view, created on first use; tiles are packed into it left to right."""
+    rows = _card_build["rows"]
+    while len(rows) <= r:
+        row = tk.Frame(_card_build["grid"], bg=C["bg"])
+        row.pack(fill="x", anchor="w")
+        rows.append(row)
+    return rows[r]
+
+
+def _new_card(i):
+    """Create the card for step i in the current view mode and append it to step_cards."""
+    if view_mode == "grid":
+        # Row frame first: a tile packed -in a sibling must sit above it in stacking order
+        row = _grid_row(i // _card_build["cols"])
+        card = GridCard(_card_build["grid"], i)
+        card.outer.pack(in_=row, **_GRID_PACK)
+    elif view_mode == "list":
+        card = ListCard(cards_scroll, i)
+    else:
+        card = StepCard(cards_scroll, i)
+    step_cards.append(card)
+    _painted_sel[0] = None
+
+
+def _ensure_cards_built(n):
+    """Build any not-yet-created cards up to step index n-1 right away."""
+    n = min(n, len(log_data))
+    while len(step_cards) < n:
+        _new_card(len(step_cards))
+
+
+def _build_cards_batch():
+    _card_build["after"] = None
+    _ensure_cards_built(len(step_cards) + _CARD_BATCH)
+    if len(step_cards) < len(log_data):
+        _card_build["after"] = root.after(15, _build_cards_batch)
+    else:
+        _refresh_card_highlights()
+    _on_cards_scroll()   # newly built cards may be in view
+
+
 def _drain_card_load_results():
     """Process completed background image loads (main thread only)."""
     applied = 0
     while True:
         try:
-            index, img_path, mtime, result = _card_load_result_queue.get_nowait()
+            index, img_path, mtime, max_w, result = _card_load_result_queue.get_nowait()
         except queue.Empty:
             break
         _card_load_pending.discard(index)
@@ -2282,7 +2693,7 @@ def _drain_card_load_results():
         if not step_cards or index >= len(step_cards):
             continue
         card = step_cards[index]
-        if not isinstance(card, StepCard) or card.index != index or card.is_text_only:
+        if not isinstance(card, StepCard) or card.index != index or card.canvas is None:
             continue
         if not current_session:
             continue
@@ -2294,13 +2705,8 @@ def _drain_card_load_results():
         card._apply_loaded_image(resized_pil, disp_size, orig_size)
         card._loaded = True
         applied += 1
-        crop_tuple = step_crops.get(index)
-        crop_key = (crop_tuple["x1"], crop_tuple["y1"], crop_tuple["x2"], crop_tuple["y2"]) if crop_tuple else ()
-        cache_key = (img_path, mtime, crop_key)
-        if len(_CARD_IMAGE_CACHE) >= _CARD_CACHE_MAX:
-            for k in list(_CARD_IMAGE_CACHE)[: _CARD_CACHE_MAX // 2]:
-                _CARD_IMAGE_CACHE.pop(k, None)
-        _CARD_IMAGE_CACHE[cache_key] = (card._photo, disp_size, orig_size)
+        _card_cache_put(_card_cache_key(index, img_path, mtime, max_w),
+                        (card._photo, disp_size, orig_size))
     if applied:
         root.after(30, _drain_card_load_results)
 
@@ -2315,7 +2721,10 @@ def _lazy_load_visible_cards():
     except Exception:
         return
     for card in step_cards:
-        if not isinstance(card, StepCard) or card._loaded or card.is_text_only:
+        if card._pending_reload:
+            card.reload_image()   # re-flags itself if still off-screen
+            continue
+        if card._loaded or (isinstance(card, StepCard) and card.canvas is None):
             continue
         if card.index in _card_load_pending:
             continue
@@ -2325,6 +2734,10 @@ def _lazy_load_visible_cards():
         except Exception:
             continue
         if wy + wh >= cy and wy <= cy + ch:
+            if not isinstance(card, StepCard):
+                card._load_thumb()   # list/grid thumbnails are small — load inline
+                card._loaded = True
+                continue
             entry = log_data[card.index]
             img_path = os.path.join(current_session, entry["screenshot"]) if current_session and entry.get("screenshot") else ""
             if not img_path or not os.path.exists(img_path):
@@ -2359,25 +2772,74 @@ def _reset_cards_scroll():
 
 
 def _append_card():
-    i = len(log_data) - 1
-    if view_mode == "default":
-        step_cards.append(StepCard(cards_scroll, i))
-    elif view_mode == "list":
-        step_cards.append(ListCard(cards_scroll, i))
-    else:
-        _build_all_cards()
+    if view_mode == "grid" or _rebuild_after[0] is not None:
+        _schedule_build_all_cards()
         return
+    _ensure_cards_built(len(log_data))
     _refresh_sidebar()
     root.after(80, lambda: cards_scroll._parent_canvas.yview_moveto(1.0))
     root.after(120, _lazy_load_visible_cards)
 
 
 def _swap_steps(a, b):
-    """Swap two adjacent steps and rebuild."""
+    """Swap two adjacent steps, moving their existing cards instead of rebuilding."""
     log_data[a], log_data[b] = log_data[b], log_data[a]
-    step_objects[a], step_objects[b] = step_objects.get(b, []), step_objects.get(a, [])
-    step_crops[a], step_crops[b] = step_crops.get(b), step_crops.get(a)
-    _renumber_and_rebuild(scroll_to=min(a, b))
+    step_objects[a], step_objects[b] = step_objects[b], step_objects[a]
+    step_crops[a], step_crops[b] = step_crops[b], step_crops[a]
+    if not _move_card(a, b, scroll_to=min(a, b)):
+        _renumber_and_rebuild(scroll_to=min(a, b))
+
+
+def _move_card(src, dst, scroll_to=None):
+    """Mirror a src→dst step move (already applied to log_data) on the existing cards.
+    Returns False when the cards are out of sync and a full rebuild is needed instead."""
+    if _rebuild_after[0] is not None or len(step_cards) != len(log_data):
+        return False
+    for i, s in enumerate(log_data):
+        s["step"] = i + 1
+    save_steps()
+    lo, hi = sorted((src, dst))
+    # Undo history follows its step
+    stacks = [undo_stacks.pop(i, None) for i in range(lo, hi + 1)]
+    stacks.insert(dst - lo, stacks.pop(src - lo))
+    for i, stack in enumerate(stacks, lo):
+        if stack:
+            undo_stacks[i] = stack
+    step_cards.insert(dst, step_cards.pop(src))
+    _relayout_cards(lo, hi)
+    _refresh_sidebar()
+    _refresh_card_highlights()
+    target = dst if scroll_to is None else scroll_to
+    root.after(120, lambda: _scroll_to_card(target))
+    return True
+
+
+def _relayout_cards(lo, hi):
+    """Reposition and reindex step_cards[lo..hi] after the list was permuted."""
+    moved = step_cards[lo:hi + 1]
+    _painted_sel[0] = None   # borders moved with their cards
+    if view_mode == "grid":
+        cols = _card_build["cols"]
+        for i in range(lo, hi + 1):
+            w = step_cards[i].outer
+            r, c = divmod(i, cols)
+            if c:
+                w.pack_configure(in_=_grid_row(r), after=step_cards[i - 1].outer, **_GRID_PACK)
+            else:
+                row = _grid_row(r)
+                first = row.pack_slaves()
+                if first and str(first[0]) != str(w):
+                    w.pack_configure(in_=row, before=first[0], **_GRID_PACK)
+                else:
+                    w.pack_configure(in_=row, **_GRID_PACK)
+            w.lift()   # tiles are siblings of the row frames and must stack above them
+    else:
+        if lo == 0 and len(step_cards) > 1:
+            step_cards[0].outer.pack_configure(before=step_cards[1].outer)
+        for i in range(max(lo, 1), hi + 1):
+            step_cards[i].outer.pack_configure(after=step_cards[i - 1].outer)
+    for i, card in enumerate(moved, lo):
+        card.reindex(i)
 
 
 def _renumber_and_rebuild(scroll_to=None):
@@ -2385,13 +2847,15 @@ def _renumber_and_rebuild(scroll_to=None):
         s["step"] = i + 1
     save_steps()
     undo_stacks.clear()
-    _build_all_cards()
+    _schedule_build_all_cards()
     if scroll_to is not None:
         root.after(120, lambda: _scroll_to_card(scroll_to))
 
 
 def _scroll_to_card(index):
     """Scroll the cards area so the step at index is visible (works in default, list, grid)."""
+    if _rebuild_after[0] is None:
+        _ensure_cards_built(index + 1)
     if not step_cards or index >= len(step_cards):
         return
     try:
@@ -2421,50 +2885,55 @@ def _reorder_step(src, dst):
     """Move step from index src to index dst, updating all data structures."""
     if src == dst or not (0 <= src < len(log_data)) or not (0 <= dst < len(log_data)):
         return
-    n = len(log_data)
-    entries    = list(log_data)
-    objs_list  = [step_objects.get(i, []) for i in range(n)]
-    crops_list = [step_crops.get(i) for i in range(n)]
+    # In place on every parallel list — log_data is never observed half-rebuilt
+    log_data.insert(dst, log_data.pop(src))
+    step_objects.insert(dst, step_objects.pop(src))
+    step_crops.insert(dst, step_crops.pop(src))
+    if not _move_card(src, dst):
+        _renumber_and_rebuild(scroll_to=dst)
+    _set_status(f"Moved step to position {dst + 1}", C["accent"])
 
-    entry = entries.pop(src)
-    obj   = objs_list.pop(src)
-    crop  = crops_list.pop(src)
 
-    entries.insert(dst, entry)
-    objs_list.insert(dst, obj)
-    crops_list.insert(dst, crop)
+# ══════════════════════════════════════ SIDEBAR ══════════════════════════════════════
 
-    log_data.clear()
-    log_data.extend(entries)
-    step_objects.clear()
-    step_crops.clear()
-    for i in range(n):
-        step_objects[i] = objs_list[i]
-        if crops_list[i] is not None:
-            step_crops[i] = crops_list[i]
-    _renumber_and_rebuild(scroll_to=dst)
-    _set_status(f"Moved step to position {dst + 1}", C["accent"])
+_sidebar_drag = {"active": False, "src": -1, "dst": -1, "line": None, "suppress_sel": False,
+                 "muted": -1}   # row currently greyed out as the drag source
+_motion_pending = {"card": None, "sidebar": None}   # after ids of throttled drag-motion flushes
+_MOTION_MS = 16   # ~one frame at 60 Hz
+_motion_xy = {"card": (0, 0), "sidebar": 0}          # latest pointer position seen per drag
 
 
-# ══════════════════════════════════════ SIDEBAR ══════════════════════════════════════
+_sidebar_labels: list = []   # rows currently in sidebar_list, diffed by _refresh_sidebar
+_sidebar_count = [-1]        # step count currently shown in count_label
+
 
-_sidebar_drag = {"active": False, "src": -1, "dst": -1, "line": None, "suppress_sel": False}
+def _sidebar_label(entry):
+    desc = entry["description"]
+    sep, cap = (". [note] ", 30) if entry.get("screenshot") is None else (".  ", 36)
+    if len(desc) > cap:
+        desc = desc[:cap] + "…"
+    return f"  {entry['step']:>2}{sep}{desc}"
 
 
 def _refresh_sidebar():
-    sidebar_list.delete(0, tk.END)
-    for entry in log_data:
-        desc    = entry["description"]
-        is_note = entry.get("screenshot") is None
-        if is_note:
-            trunc = desc[:30] + "…" if len(desc) > 30 else desc
-            label = f"  {entry['step']:>2}. [note] {trunc}"
-        elif len(desc) > 36:
-            label = f"  {entry['step']:>2}.  {desc[:36]}…"
-        else:
-            label = f"  {entry['step']:>2}.  {desc}"
-        sidebar_list.insert(tk.END, label)
-    count_label.configure(text=f"{len(log_data)} step{'s' if len(log_data)!=1 else ''}")
+    """Sync the sidebar listbox with log_data, touching only rows whose label changed."""
+    new_labels = [_sidebar_label(entry) for entry in log_data]
+    old_labels = _sidebar_labels
+    if new_labels != old_labels:
+        common = min(len(old_labels), len(new_labels))
+        for i in range(common):
+            if old_labels[i] != new_labels[i]:
+                sidebar_list.delete(i)
+                sidebar_list.insert(i, new_labels[i])
+        if len(old_labels) > common:
+            sidebar_list.delete(common, tk.END)
+        if len(new_labels) > common:
+            sidebar_list.insert(tk.END, *new_labels[common:])   # one Tcl call for all new rows
+        _sidebar_labels[:] = new_labels
+    n = len(log_data)
+    if _sidebar_count[0] != n:
+        _sidebar_count[0] = n
+        count_label.configure(text=f"{n} step{'s' if n!=1 else ''}")
 
 
 def _sidebar_drop_index(event_y):
@@ -2538,22 +3007,46 @@ def _on_sidebar_sel_change(event):
 
 
 def _sidebar_motion(event):
+    """Throttled like _card_drag_motion."""
+    _motion_xy["sidebar"] = event.y
+    if _motion_pending["sidebar"] is None:
+        _motion_pending["sidebar"] = root.after(_MOTION_MS, _flush_sidebar_motion)
+
+
+def _flush_sidebar_motion():
+    if _motion_pending["sidebar"] is not None:
+        root.after_cancel(_motion_pending["sidebar"])
+        _motion_pending["sidebar"] = None
+        _do_sidebar_motion(_motion_xy["sidebar"])
+
+
+def _do_sidebar_motion(y):
     src = _sidebar_drag["src"]
     if src < 0 or not log_data:
         return
     _sidebar_drag["active"]       = True
     _sidebar_drag["suppress_sel"] = True
-    dst = _sidebar_drop_index(event.y)
+    dst = _sidebar_drop_index(y)
     _sidebar_drag["dst"] = dst
     sidebar_list.selection_clear(0, tk.END)
     sidebar_list.selection_set(src)
-    for i in range(sidebar_list.size()):
-        fg = C["muted"] if i == src else C["text"]
-        sidebar_list.itemconfigure(i, fg=fg)
+    if _sidebar_drag["muted"] != src:
+        _sidebar_unmute_row()
+        sidebar_list.itemconfigure(src, fg=C["muted"])
+        _sidebar_drag["muted"] = src
     _sidebar_show_line(dst)
 
 
+def _sidebar_unmute_row():
+    """Restore the text colour of the row greyed out by a sidebar drag, if any."""
+    muted = _sidebar_drag["muted"]
+    _sidebar_drag["muted"] = -1
+    if 0 <= muted < sidebar_list.size():
+        sidebar_list.itemconfigure(muted, fg=C["text"])
+
+
 def _sidebar_release(event):
+    _flush_sidebar_motion()
     was_drag = _sidebar_drag["active"]
     src      = _sidebar_drag["src"]
     dst      = _sidebar_drag["dst"]
@@ -2562,8 +3055,7 @@ def _sidebar_release(event):
     _sidebar_drag["src"]          = -1
     _sidebar_drag["dst"]          = -1
     _sidebar_hide_line()
-    for i in range(sidebar_list.size()):
-        sidebar_list.itemconfigure(i, fg=C["text"])
+    _sidebar_unmute_row()
     if not was_drag or src < 0 or not log_data:
         return
     dst = max(0, min(dst, len(log_data) - 1))
@@ -2622,68 +3114,87 @@ def _show_steps_context_menu(event):
     menu.post(event.x_root, event.y_root)
 
 
-def _bind_card_context(card):
-    """Bind right-click context menu + Ctrl/Shift click selection to a card."""
-    def _on_right(event):
-        # If right-clicked card is not in selection, replace selection with it
-        if card.index not in _selected:
-            _selected.clear()
-            _selected.add(card.index)
-            _apply_sidebar_selection()
-            _refresh_card_highlights()
-        _show_steps_context_menu(event)
-
-    def _on_left(event):
-        global _sel_anchor
-        idx   = card.index
-        ctrl  = (event.state & 0x0004) != 0
-        shift = (event.state & 0x0001) != 0
-        if shift and _sel_anchor >= 0:
-            lo, hi = sorted([_sel_anchor, idx])
-            _selected.clear()
-            for i in range(lo, hi + 1):
-                _selected.add(i)
-        elif ctrl:
-            if idx in _selected:
-                _selected.discard(idx)
-            else:
-                _selected.add(idx)
-            _sel_anchor = idx
-        else:
-            _selected.clear()
-            _selected.add(idx)
-            _sel_anchor = idx
+_CARD_TAG_ANY   = "PsrCard"        # bindtag for right-click: every card widget outside annotation canvases
+_CARD_TAG_CLICK = "PsrCardClick"   # bindtag for click-select / double-click: also skips inputs and buttons
+_CARD_CLICK_SKIP = (tk.Text, ctk.CTkEntry, ctk.CTkButton, tk.Button, ctk.CTkCheckBox)
+
+
+def _bind_card_context(card, widget=None):
+    """Tag a card (or one subtree of it) so the shared card context/selection bindings apply."""
+    card.outer._psr_card = card
+    stack = [(widget or card.outer, False)]
+    while stack:
+        w, no_click = stack.pop()
+        # Skip the annotation canvas — it has its own annotation-aware right-click handler.
+        # CTkCanvas subclasses tk.Canvas but is what every CTk widget actually draws on, so it is tagged.
+        if type(w) is tk.Canvas:
+            continue
+        # Inputs and buttons draw on internal children too; none of those may select the card
+        no_click = no_click or isinstance(w, _CARD_CLICK_SKIP)
+        tags = w.bindtags()
+        if _CARD_TAG_ANY not in tags:
+            extra = (_CARD_TAG_ANY,) if no_click else (_CARD_TAG_ANY, _CARD_TAG_CLICK)
+            w.bindtags(tags + extra)
+        stack.extend((c, no_click) for c in w.winfo_children())
+
+
+def _card_from_event(event):
+    """The card whose widget tree contains event.widget, or None."""
+    w = event.widget
+    while w is not None and not isinstance(w, str):
+        card = getattr(w, "_psr_card", None)
+        if card is not None:
+            return card
+        w = w.master
+    return None
+
+
+def _on_card_right(event):
+    card = _card_from_event(event)
+    if card is None:
+        return
+    # If right-clicked card is not in selection, replace selection with it
+    if card.index not in _selected:
+        _selected.clear()
+        _selected.add(card.index)
         _apply_sidebar_selection()
         _refresh_card_highlights()
-        root.after(10, lambda i=idx: _scroll_to_card(i))
+    _show_steps_context_menu(event)
+
+
+def _on_card_left(event):
+    global _sel_anchor
+    card = _card_from_event(event)
+    if card is None:
+        return
+    idx   = card.index
+    ctrl  = (event.state & 0x0004) != 0
+    shift = (event.state & 0x0001) != 0
+    if shift and _sel_anchor >= 0:
+        lo, hi = sorted([_sel_anchor, idx])
+        _selected.clear()
+        for i in range(lo, hi + 1):
+            _selected.add(i)
+    elif ctrl:
+        if idx in _selected:
+            _selected.discard(idx)
+        else:
+            _selected.add(idx)
+        _sel_anchor = idx
+    else:
+        _selected.clear()
+        _selected.add(idx)
+        _sel_anchor = idx
+    _apply_sidebar_selection()
+    _refresh_card_highlights()
+    root.after(10, lambda i=idx: _scroll_to_card(i))
 
+
+def _on_card_dbl(event):
     # Double-click on overview cards → open in detail view
+    card = _card_from_event(event)
     if isinstance(card, (ListCard, GridCard)):
-        def _on_dbl(event, _idx=card.index):
-            _open_in_detail(_idx)
-        def _bind_dbl(widget):
-            if not isinstance(widget, (tk.Text, ctk.CTkEntry, ctk.CTkButton,
-                                        tk.Button, ctk.CTkCheckBox)):
-                try: widget.bind("<Double-Button-1>", _on_dbl)
-                except Exception: pass
-            for child in widget.winfo_children():
-                _bind_dbl(child)
-        _bind_dbl(card.outer)
-
-    def _bind_recursive(widget):
-        # Skip tk.Canvas — it has its own annotation-aware right-click handler
-        if isinstance(widget, tk.Canvas):
-            return
-        try: widget.bind("<Button-3>", _on_right)
-        except Exception: pass
-        if not isinstance(widget, (tk.Text, ctk.CTkEntry, ctk.CTkButton,
-                                    tk.Button, ctk.CTkCheckBox)):
-            try: widget.bind("<ButtonPress-1>", _on_left, add="+")
-            except Exception: pass
-        for child in widget.winfo_children():
-            _bind_recursive(child)
-
-    _bind_recursive(card.outer)
+        _open_in_detail(card.index)
 
 
 # ══════════════════════════════════════ CARD DND ══════════════════════════════════════
@@ -2696,18 +3207,18 @@ _AUTO_SCROLL  = 40
 
 
 def _card_drag_cleanup():
-    """Destroy ghost/line widgets and reset all DnD state — safe to call anytime."""
+    """Hide ghost/line widgets (kept for the next drag) and reset all DnD state — safe to call anytime."""
     ghost = _card_drag.pop("ghost", None)
     if ghost:
-        try: ghost.destroy()
+        try: ghost.withdraw()
         except Exception: pass
     _card_drag["ghost"] = None
 
-    line = _card_drag.pop("line", None)
+    line = _card_drag.get("line")
     if line:
-        try: line.destroy()
+        try: line.place_forget()
         except Exception: pass
-    _card_drag["line"] = None
+    _card_geom_cache.clear()
 
     hi = _card_drag.get("hi_card", -1)
     if 0 <= hi < len(step_cards):
@@ -2723,6 +3234,32 @@ def _card_drag_cleanup():
     _card_drag["active"] = False
     _card_drag["src"]    = -1
     _card_drag["dst"]    = -1
+    _painted_sel[0] = None   # drag feedback overwrote some borders
+
+
+_ghost_cache = {"win": None, "step_lbl": None, "desc_lbl": None}
+
+
+def _card_ghost(src):
+    """Withdrawn drag ghost labelled for step src; the Toplevel is built once and reused."""
+    win = _ghost_cache["win"]
+    if win is None or not win.winfo_exists():
+        win = tk.Toplevel(root)
+        win.withdraw()
+        win.overrideredirect(True)
+        win.attributes("-alpha", _GHOST_ALPHA)
+        win.configure(bg=C["panel"])
+        inner = tk.Frame(win, bg=C["panel"], padx=10, pady=6)
+        inner.pack()
+        step_lbl = tk.Label(inner, bg=C["accent"], fg="#fff",
+                            font=("Courier New", 10, "bold"), padx=6, pady=2)
+        step_lbl.pack(side="left")
+        desc_lbl = tk.Label(inner, bg=C["panel"], fg=C["text"], font=("Segoe UI", 9))
+        desc_lbl.pack(side="left", padx=(6,0))
+        _ghost_cache.update(win=win, step_lbl=step_lbl, desc_lbl=desc_lbl)
+    _ghost_cache["step_lbl"].configure(text=f"  STEP {src+1:02d}  ")
+    _ghost_cache["desc_lbl"].configure(text=f"  {log_data[src]['description'][:40]}")
+    return win
 
 
 def _card_drag_start(index, event):
@@ -2730,6 +3267,20 @@ def _card_drag_start(index, event):
     _card_drag["active"] = False
 
 
+_card_geom_cache: dict = {}   # card index → (y, height, width) inside cards_scroll; reset on layout changes
+
+
+def _card_geom(i):
+    """Card geometry for drop feedback; layout is flushed once per drag rather than per motion."""
+    g = _card_geom_cache.get(i)
+    if g is None:
+        if not _card_geom_cache:
+            cards_scroll.update_idletasks()
+        w = step_cards[i].outer
+        g = _card_geom_cache[i] = (w.winfo_y(), w.winfo_height(), w.winfo_width())
+    return g
+
+
 def _card_show_drop_line(dst):
     """Show drop feedback: horizontal line for list/default, border highlight for grid."""
     if not step_cards:
@@ -2751,13 +3302,10 @@ def _card_show_drop_line(dst):
         line = tk.Frame(cards_scroll, height=_DROP_LINE_H, bg=C["accent"])
         _card_drag["line"] = line
 
-    target = step_cards[min(dst, len(step_cards) - 1)]
     try:
-        target.outer.update_idletasks()
-        ty = target.outer.winfo_y()
-        tw = target.outer.winfo_width()
+        ty, th, tw = _card_geom(min(dst, len(step_cards) - 1))
         if dst >= len(step_cards):
-            ty = target.outer.winfo_y() + target.outer.winfo_height() + 4
+            ty += th + 4
         line.place(in_=cards_scroll, x=6, y=ty - 4, width=tw - 12, height=_DROP_LINE_H)
         line.lift()
     except Exception:
@@ -2778,42 +3326,46 @@ def _card_auto_scroll(y_root):
 
 
 def _card_drag_motion(event):
+    """Record the pointer and handle it at most once per frame (latest position wins)."""
+    _motion_xy["card"] = (event.x_root, event.y_root)
+    if _motion_pending["card"] is None:
+        _motion_pending["card"] = root.after(_MOTION_MS, _flush_card_motion)
+
+
+def _flush_card_motion():
+    if _motion_pending["card"] is not None:
+        root.after_cancel(_motion_pending["card"])
+        _motion_pending["card"] = None
+        _do_card_drag_motion(*_motion_xy["card"])
+
+
+def _do_card_drag_motion(x_root, y_root):
     src = _card_drag["src"]
     if src < 0 or not log_data:
         return
     _card_drag["active"] = True
 
     ghost = _card_drag.get("ghost")
-    if ghost is None:
-        ghost = tk.Toplevel(root)
-        ghost.overrideredirect(True)
-        ghost.attributes("-alpha", _GHOST_ALPHA)
-        ghost.configure(bg=C["panel"])
-        inner = tk.Frame(ghost, bg=C["panel"], padx=10, pady=6)
-        inner.pack()
-        tk.Label(inner, text=f"  STEP {src+1:02d}  ",
-                 bg=C["accent"], fg="#fff",
-                 font=("Courier New", 10, "bold"),
-                 padx=6, pady=2).pack(side="left")
-        desc = log_data[src]["description"][:40]
-        tk.Label(inner, text=f"  {desc}",
-                 bg=C["panel"], fg=C["text"],
-                 font=("Segoe UI", 9)).pack(side="left", padx=(6,0))
-        _card_drag["ghost"] = ghost
+    first = ghost is None
+    if first:
+        ghost = _card_drag["ghost"] = _card_ghost(src)
         if src < len(step_cards):
             try: step_cards[src].outer.configure(fg_color="#0c0c0c", border_color="#1a1a1a")
             except Exception: pass
 
-    ghost.geometry(f"+{event.x_root + 16}+{event.y_root - 12}")
+    ghost.geometry(f"+{x_root + 16}+{y_root - 12}")
+    if first:
+        ghost.deiconify()
     ghost.lift()
 
-    dst = _compute_drop_index(event.x_root, event.y_root, allow_after_last=False)
+    dst = _compute_drop_index(x_root, y_root, allow_after_last=False)
     _card_drag["dst"] = dst
     _card_show_drop_line(dst)
-    _card_auto_scroll(event.y_root)
+    _card_auto_scroll(y_root)
 
 
 def _card_drag_release(event):
+    _flush_card_motion()   # apply the last throttled move so the drop lands where the pointer is
     was_drag = _card_drag["active"]
     src      = _card_drag["src"]
     dst      = _card_drag["dst"]
@@ -2829,6 +3381,29 @@ def _card_drag_release(event):
 
 # ══════════════════════════════════════ TOOL / COLOUR ══════════════════════════════════════
 
+_tool_opts_shown = [None]   # (swatches, pen sizes) visibility last applied to the tool strip
+
+
+def _show_tool_options(colors, pens):
+    """Show/hide the draw option widgets. Skips pack entirely when the visible set is
+    unchanged; otherwise hides everything first, then packs the new set in order."""
+    if _tool_opts_shown[0] == (colors, pens):
+        return
+    _tool_opts_shown[0] = (colors, pens)
+    _draw_sep1.pack_forget()
+    _draw_sep2.pack_forget()
+    for btn, _ in draw_color_btns + pen_size_btns:
+        btn.pack_forget()
+    if colors:
+        _draw_sep1.pack(side="left", fill="y", pady=8, padx=6)
+        for btn, _ in draw_color_btns:
+            btn.pack(side="left", padx=2, pady=12)
+    if pens:
+        _draw_sep2.pack(side="left", fill="y", pady=8, padx=6)
+        for btn, _ in pen_size_btns:
+            btn.pack(side="left", padx=2, pady=9)
+
+
 def set_tool(tool):
     global annotation_tool
     annotation_tool = tool
@@ -2846,27 +3421,9 @@ def set_tool(tool):
     cursor = "crosshair" if tool != "none" else "arrow"
     for card in step_cards:
         if card.canvas:
-            card.canvas.configure(cursor=cursor)
+            card._set_cursor(cursor)
     # Show colour swatches for draw + highlight; pen sizes only for draw
-    if tool in ("draw", "highlight"):
-        _draw_sep1.pack(side="left", fill="y", pady=8, padx=6)
-        for btn, _ in draw_color_btns:
-            btn.pack(side="left", padx=2, pady=12)
-        if tool == "draw":
-            _draw_sep2.pack(side="left", fill="y", pady=8, padx=6)
-            for btn, _ in pen_size_btns:
-                btn.pack(side="left", padx=2, pady=9)
-        else:
-            for btn, _ in pen_size_btns:
-                btn.pack_forget()
-            _draw_sep2.pack_forget()
-    else:
-        for btn, _ in draw_color_btns:
-            btn.pack_forget()
-        for btn, _ in pen_size_btns:
-            btn.pack_forget()
-        _draw_sep1.pack_forget()
-        _draw_sep2.pack_forget()
+    _show_tool_options(tool in ("draw", "highlight"), tool == "draw")
     hints = {
         "none":      "Pointer — click object to select, drag to move, handles to resize",
         "highlight": "Highlight — drag a coloured box  ·  active colour sets box colour",
@@ -2878,12 +3435,14 @@ def set_tool(tool):
 
 
 def _sync_color_swatches(hex_color):
-    for btn, col in draw_color_btns:
-        if col is None:
-            continue
-        btn.configure(
-            border_width=2 if col==hex_color else 1,
-            border_color="#ffffff" if col==hex_color else "#555555")
+    prev = _painted_color[0]
+    if prev == hex_color:
+        return
+    _painted_color[0] = hex_color
+    if prev in _color_btn_map:
+        _color_btn_map[prev].configure(border_width=1, border_color="#555555")
+    if hex_color in _color_btn_map:
+        _color_btn_map[hex_color].configure(border_width=2, border_color="#ffffff")
 
 
 def _set_draw_color_global(hex_color):
@@ -2900,10 +3459,14 @@ def _set_draw_color_global(hex_color):
 def _set_draw_width_global(w):
     global draw_width
     draw_width = w
-    for btn, bw in pen_size_btns:
-        btn.configure(
-            fg_color=C["acc_dark"] if bw==w else "transparent",
-            border_color=C["accent"] if bw==w else C["border"])
+    prev = _painted_width[0]
+    if prev == w:
+        return
+    _painted_width[0] = w
+    if prev in _pen_btn_map:
+        _pen_btn_map[prev].configure(fg_color="transparent", border_color=C["border"])
+    if w in _pen_btn_map:
+        _pen_btn_map[w].configure(fg_color=C["acc_dark"], border_color=C["accent"])
 
 
 # ══════════════════════════════════════ VIEW MODE ══════════════════════════════════════
@@ -2919,9 +3482,15 @@ def _open_in_detail(idx):
     root.after(160, lambda: _scroll_to_card(idx))
 
 
+_tool_strip_state = [None]   # state last applied by _set_tool_strip_enabled
+
+
 def _set_tool_strip_enabled(enabled):
     """Grey out / restore all tool strip interactive widgets."""
     s = "normal" if enabled else "disabled"
+    if _tool_strip_state[0] == s:
+        return
+    _tool_strip_state[0] = s
     for btn in (btn_pointer, btn_highlight, btn_redact, btn_crop, btn_draw):
         btn.configure(state=s)
     for btn, _ in draw_color_btns:
@@ -2930,6 +3499,9 @@ def _set_tool_strip_enabled(enabled):
         btn.configure(state=s)
 
 
+_applied_view_chrome = [None]   # (mode, Back destination) the tabs were last laid out for
+
+
 def _set_view_mode(mode):
     global view_mode, _prev_view_mode
     # Capture previous mode before overwriting — so clicking ✎ Edit from list/grid
@@ -2938,31 +3510,30 @@ def _set_view_mode(mode):
         _prev_view_mode = view_mode
     same_mode = (mode == view_mode)
     view_mode = mode
-    # Update view tab highlight states
-    for btn, m in view_mode_btns:
-        active = (m == mode)
-        btn.configure(
-            fg_color=C["acc_dark"] if active else "transparent",
-            border_color=C["accent"] if active else C["border"])
-    if mode == "default":
-        # Edit mode: enable tools, hide the Edit tab (already here),
-        # always show ← Back so the user can reach the overview.
-        _set_tool_strip_enabled(bool(log_data))
+    _set_tool_strip_enabled(bool(log_data) if mode == "default" else False)
+    # Tabs / Back button only depend on the mode and where Back leads; re-showing the
+    # same view (e.g. show_editing after a recording) leaves them untouched
+    dest = (_prev_view_mode or "list") if mode == "default" else None
+    if _applied_view_chrome[0] != (mode, dest):
+        _applied_view_chrome[0] = (mode, dest)
+        # Update view tab highlight states
         for btn, m in view_mode_btns:
-            if m == "default":
-                btn.pack_forget()   # hide only the Edit tab
-            else:
-                btn.pack_forget()   # also hide List/Grid tabs — overview via Back only
-        # Always show Back in edit mode; label reflects where it will go.
-        dest = _prev_view_mode or "list"
-        btn_back.configure(text=f"← {'List' if dest == 'list' else 'Grid'}")
-        btn_back.pack(side="left", padx=(8, 2), pady=5)
-    else:
-        # List / Grid: grey out tools, show List + Grid + Edit tabs, hide Back
-        _set_tool_strip_enabled(False)
-        btn_back.pack_forget()
-        for btn, m in view_mode_btns:
-            btn.pack(side="left", padx=(8 if m == "list" else 2, 2), pady=5)
+            active = (m == mode)
+            btn.configure(
+                fg_color=C["acc_dark"] if active else "transparent",
+                border_color=C["accent"] if active else C["border"])
+        if mode == "default":
+            # Edit mode: hide the Edit tab (already here) and the List/Grid tabs —
+            # overview via Back only. Back's label reflects where it will go.
+            for btn, _m in view_mode_btns:
+                btn.pack_forget()
+            btn_back.configure(text=f"← {'List' if dest == 'list' else 'Grid'}")
+            btn_back.pack(side="left", padx=(8, 2), pady=5)
+        else:
+            # List / Grid: show List + Grid + Edit tabs, hide Back
+            btn_back.pack_forget()
+            for btn, m in view_mode_btns:
+                btn.pack(side="left", padx=(8 if m == "list" else 2, 2), pady=5)
     # Skip rebuild when re-applying same mode and card count matches (e.g. returning from
     # recording): preserves existing cards and their undo history.
     if same_mode and len(step_cards) == len(log_data) and step_cards:
@@ -2970,7 +3541,7 @@ def _set_view_mode(mode):
         _refresh_ui_state()
         root.after(30, _refresh_card_highlights)
     else:
-        _build_all_cards()
+        _schedule_build_all_cards()
 
 
 # ══════════════════════════════════════ PROJECT NAME ══════════════════════════════════════
@@ -2980,7 +3551,7 @@ def _apply_project_name():
     project_name = project_name_var.get().strip()
     if current_session:
         save_steps()
-    root.title(f"PSR Pro — {project_name}" if project_name else "PSR Pro — Process Step Recorder")
+    _set_wm(title=f"PSR Pro — {project_name}" if project_name else "PSR Pro — Process Step Recorder")
 
 
 # ══════════════════════════════════════ RECORDING ACTIONS ══════════════════════════════════════
@@ -3115,13 +3686,15 @@ def start_recording(name_override=None, parent_dir_override=None):
     log_data.clear()
     step_objects.clear()
     step_crops.clear()
+    _step_b64_cache.clear()
+    _pdf_safe.cache_clear()
     step_counter = 1
     recording    = True
     btn_start.configure(state="disabled")
     btn_stop.configure(state="normal")
     btn_continue.configure(state="disabled")
     _build_all_cards()
-    threading.Thread(target=start_listeners, daemon=True).start()
+    _submit_listeners()
     show_recording()
 
 
@@ -3147,7 +3720,7 @@ def continue_recording():
     btn_start.configure(state="disabled")
     btn_stop.configure(state="normal")
     btn_continue.configure(state="disabled")
-    threading.Thread(target=start_listeners, daemon=True).start()
+    _submit_listeners()
     show_recording()
 
 
@@ -3159,8 +3732,8 @@ def _do_load_recording(folder):
     if not os.path.exists(json_path):
         messagebox.showerror("Error", "No steps.json found.")
         return False
-    with open(json_path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    with open(json_path, "rb") as f:
+        raw = _json_loads(f.read())
 
     # Support old list format and new {project_name, steps} format
     if isinstance(raw, list):
@@ -3176,16 +3749,17 @@ def _do_load_recording(folder):
         crop = entry.pop("crop", None)
         _step_id(entry)  # ensure id for fold state
         log_data.append(entry)
-        step_objects[i] = objs
-        if crop:
-            step_crops[i] = crop
+        step_objects.append(objs)
+        step_crops.append(crop or None)
     _load_global_overlay()
 
     current_session = folder
     step_counter    = len(log_data) + 1
     undo_stacks.clear()
+    _step_b64_cache.clear()
+    _pdf_safe.cache_clear()
     project_name_var.set(project_name)
-    root.title(f"PSR Pro — {project_name}" if project_name else "PSR Pro — Process Step Recorder")
+    _set_wm(title=f"PSR Pro — {project_name}" if project_name else "PSR Pro — Process Step Recorder")
     _build_all_cards()
     _set_status(f"📂  Loaded: {os.path.basename(folder)}  ({len(log_data)} steps)", C["accent"])
     btn_continue.configure(state="normal" if current_session else "disabled")
@@ -3213,106 +3787,104 @@ def _export_filename(ext):
     return os.path.join(current_session, f"{name}.{ext}")
 
 
-def export_html():
-    if not log_data:
-        messagebox.showwarning("Nothing to export", "No steps to export."); return
-    title       = _export_title()
-    report_path = _export_filename("html")
-    total       = len(log_data)
-    gen_date    = datetime.now().strftime('%Y-%m-%d %H:%M')
-    gen_year    = datetime.now().year
+def _minify_css(css):
+    """Drop comments and the whitespace around CSS punctuation."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    css = re.sub(r"\s+", " ", css)
+    return css.replace(";}", "}").strip()
 
-    # Pre-encode all images once (shared by both views)
-    step_images = []
-    for i, entry in enumerate(log_data):
-        flat = _flatten_to_pil(i)
-        if flat is not None:
-            buf = io.BytesIO()
-            flat.save(buf, "PNG")
-            step_images.append(base64.b64encode(buf.getvalue()).decode())
-        else:
-            step_images.append(None)
 
-    try:
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(f"""<!DOCTYPE html>
-<html lang="en"><head>
-<meta charset="utf-8"><title>{title}</title>
-<style>
-@import url('https://fonts.googleapis.com/css2?family=IBM+Plex+Mono:wght@400;600&family=IBM+Plex+Sans:wght@300;400;600&display=swap');
-*,*::before,*::after{{box-sizing:border-box;margin:0;padding:0}}
-:root{{--bg:#0e0e0e;--surface:#141414;--border:#252525;--accent:#3d8ef0;--accent12:rgba(61,142,240,.12);
-       --text:#e2e2e2;--muted:#666;--radius:12px}}
-html,body{{height:100%}}
-body{{background:var(--bg);color:var(--text);font-family:'IBM Plex Sans',sans-serif;font-weight:300;
-     display:flex;flex-direction:column;overflow:hidden}}
+def _minify_js(js):
+    """Drop /* */ comments, indentation and blank lines. Conservative on purpose: string
+    literals such as ' / ' keep their spaces."""
+    js = re.sub(r"/\*.*?\*/", "", js, flags=re.S)
+    return "\n".join(ln.strip() for ln in js.splitlines() if ln.strip())
+
+
+# Report stylesheet, minified once at import (the readable source stays here)
+_HTML_CSS = _minify_css("""@import url('https://fonts.googleapis.com/css2?family=IBM+Plex+Mono:wght@400;600&family=IBM+Plex+Sans:wght@300;400;600&display=swap');
+*,*::before,*::after{box-sizing:border-box;margin:0;padding:0}
+:root{--bg:#0e0e0e;--surface:#141414;--border:#252525;--accent:#3d8ef0;--accent12:rgba(61,142,240,.12);
+       --text:#e2e2e2;--muted:#666;--radius:12px}
+html,body{height:100%}
+body{background:var(--bg);color:var(--text);font-family:'IBM Plex Sans',sans-serif;font-weight:300;
+     display:flex;flex-direction:column;overflow:hidden}
 
 /* ── top bar ── */
-.topbar{{display:flex;align-items:center;justify-content:space-between;
-         padding:10px 28px;border-bottom:1px solid var(--border);flex-shrink:0}}
-.topbar h1{{font-family:'IBM Plex Mono',monospace;font-size:16px;font-weight:600;color:var(--accent)}}
-.topbar .right{{display:flex;align-items:center;gap:16px}}
-.topbar .meta{{color:var(--muted);font-family:'IBM Plex Mono',monospace;font-size:11px}}
-.view-toggle{{display:flex;gap:2px;background:var(--surface);border:1px solid var(--border);
-              border-radius:6px;padding:2px;overflow:hidden}}
-.view-toggle button{{background:none;border:none;color:var(--muted);font-family:'IBM Plex Mono',monospace;
-                     font-size:11px;padding:4px 14px;border-radius:4px;cursor:pointer;transition:.15s}}
-.view-toggle button:hover{{color:var(--text)}}
-.view-toggle button.on{{background:var(--accent);color:#fff}}
+.topbar{display:flex;align-items:center;justify-content:space-between;
+         padding:10px 28px;border-bottom:1px solid var(--border);flex-shrink:0}
+.topbar h1{font-family:'IBM Plex Mono',monospace;font-size:16px;font-weight:600;color:var(--accent)}
+.topbar .right{display:flex;align-items:center;gap:16px}
+.topbar .meta{color:var(--muted);font-family:'IBM Plex Mono',monospace;font-size:11px}
+.view-toggle{display:flex;gap:2px;background:var(--surface);border:1px solid var(--border);
+              border-radius:6px;padding:2px;overflow:hidden}
+.view-toggle button{background:none;border:none;color:var(--muted);font-family:'IBM Plex Mono',monospace;
+                     font-size:11px;padding:4px 14px;border-radius:4px;cursor:pointer;transition:.15s}
+.view-toggle button:hover{color:var(--text)}
+.view-toggle button.on{background:var(--accent);color:#fff}
 
 /* ═══════════ DECK MODE ═══════════ */
-.deck-wrap{{flex:1;display:flex;flex-direction:column;overflow:hidden}}
-.deck-wrap.hidden{{display:none}}
-.deck{{flex:1;display:flex;align-items:center;justify-content:center;position:relative;
-       overflow:hidden;padding:24px 80px}}
-.slide{{display:none;flex-direction:column;align-items:center;width:100%;max-width:1100px;
-        height:100%;animation:fadeIn .25s ease}}
-.slide.active{{display:flex}}
-@keyframes fadeIn{{from{{opacity:0;transform:translateY(8px)}}to{{opacity:1;transform:translateY(0)}}}}
-.slide.title-slide{{justify-content:center;gap:12px}}
-.slide.title-slide h2{{font-family:'IBM Plex Mono',monospace;font-size:36px;font-weight:600;color:var(--accent)}}
-.slide.title-slide p{{font-size:14px;color:var(--muted);font-family:'IBM Plex Mono',monospace}}
-.slide .step-num{{font-family:'IBM Plex Mono',monospace;font-size:11px;font-weight:600;color:var(--accent);
-                  background:var(--accent12);padding:4px 14px;border-radius:6px;white-space:nowrap;flex-shrink:0}}
-.slide .step-hdr{{display:flex;align-items:center;gap:14px;width:100%;padding:0 4px;flex-shrink:0}}
-.slide .step-desc{{font-size:14px;color:var(--text);line-height:1.5}}
-.slide .img-wrap{{flex:1;display:flex;align-items:center;justify-content:center;
-                  min-height:0;width:100%;padding:14px 0 4px}}
-.slide .img-wrap img{{max-width:100%;max-height:100%;object-fit:contain;border-radius:var(--radius);
-                      border:1px solid var(--border);background:var(--surface)}}
-.slide .note-body{{flex:1;display:flex;align-items:center;justify-content:center;
+.deck-wrap{flex:1;display:flex;flex-direction:column;overflow:hidden}
+.deck-wrap.hidden{display:none}
+.deck{flex:1;display:flex;align-items:center;justify-content:center;position:relative;
+       overflow:hidden;padding:24px 80px}
+.slide{display:none;flex-direction:column;align-items:center;width:100%;max-width:1100px;
+        height:100%;animation:fadeIn .25s ease}
+.slide.active{display:flex}
+@keyframes fadeIn{from{opacity:0;transform:translateY(8px)}to{opacity:1;transform:translateY(0)}}
+.slide.title-slide{justify-content:center;gap:12px}
+.slide.title-slide h2{font-family:'IBM Plex Mono',monospace;font-size:36px;font-weight:600;color:var(--accent)}
+.slide.title-slide p{font-size:14px;color:var(--muted);font-family:'IBM Plex Mono',monospace}
+.slide .step-num{font-family:'IBM Plex Mono',monospace;font-size:11px;font-weight:600;color:var(--accent);
+                  background:var(--accent12);padding:4px 14px;border-radius:6px;white-space:nowrap;flex-shrink:0}
+.slide .step-hdr{display:flex;align-items:center;gap:14px;width:100%;padding:0 4px;flex-shrink:0}
+.slide .step-desc{font-size:14px;color:var(--text);line-height:1.5}
+.slide .img-wrap{flex:1;display:flex;align-items:center;justify-content:center;
+                  min-height:0;width:100%;padding:14px 0 4px}
+.slide .img-wrap img{max-width:100%;max-height:100%;object-fit:contain;border-radius:var(--radius);
+                      border:1px solid var(--border);background:var(--surface)}
+.slide .note-body{flex:1;display:flex;align-items:center;justify-content:center;
                    font-size:18px;color:var(--text);line-height:1.7;text-align:center;
-                   max-width:700px;padding:40px 20px}}
-.nav{{position:absolute;top:50%;transform:translateY(-50%);width:48px;height:48px;border-radius:50%;
+                   max-width:700px;padding:40px 20px}
+.nav{position:absolute;top:50%;transform:translateY(-50%);width:48px;height:48px;border-radius:50%;
      background:var(--surface);border:1px solid var(--border);color:var(--muted);font-size:22px;
      display:flex;align-items:center;justify-content:center;cursor:pointer;transition:.15s;z-index:10;
-     user-select:none}}
-.nav:hover{{background:var(--accent);color:#fff;border-color:var(--accent)}}
-.nav.disabled{{opacity:.2;pointer-events:none}}
-.nav.prev{{left:16px}}
-.nav.next{{right:16px}}
-.bottombar{{display:flex;align-items:center;justify-content:center;gap:6px;position:relative;
-            padding:10px 28px;border-top:1px solid var(--border);flex-shrink:0}}
-.dot{{width:8px;height:8px;border-radius:50%;background:var(--border);cursor:pointer;transition:.15s}}
-.dot.active{{background:var(--accent);box-shadow:0 0 6px rgba(61,142,240,.5)}}
-.dot:hover{{background:var(--accent)}}
-.counter{{position:absolute;right:28px;font-family:'IBM Plex Mono',monospace;font-size:11px;color:var(--muted)}}
+     user-select:none}
+.nav:hover{background:var(--accent);color:#fff;border-color:var(--accent)}
+.nav.disabled{opacity:.2;pointer-events:none}
+.nav.prev{left:16px}
+.nav.next{right:16px}
+.bottombar{display:flex;align-items:center;justify-content:center;gap:6px;position:relative;
+            padding:10px 28px;border-top:1px solid var(--border);flex-shrink:0}
+.dot{width:8px;height:8px;border-radius:50%;background:var(--border);cursor:pointer;transition:.15s}
+.dot.active{background:var(--accent);box-shadow:0 0 6px rgba(61,142,240,.5)}
+.dot:hover{background:var(--accent)}
+.counter{position:absolute;right:28px;font-family:'IBM Plex Mono',monospace;font-size:11px;color:var(--muted)}
 
 /* ═══════════ LIST MODE ═══════════ */
-.list-wrap{{flex:1;overflow-y:auto;padding:40px 24px 80px}}
-.list-wrap.hidden{{display:none}}
-.list-inner{{max-width:1020px;margin:0 auto}}
-.card{{background:var(--surface);border:1px solid var(--border);border-radius:10px;overflow:hidden;margin-bottom:28px}}
-.card-hdr{{display:flex;align-items:center;gap:14px;padding:14px 20px;border-bottom:1px solid var(--border)}}
-.card-num{{font-family:'IBM Plex Mono',monospace;font-size:10px;font-weight:600;color:var(--accent);
-           background:var(--accent12);padding:3px 10px;border-radius:4px;white-space:nowrap}}
-.card-desc{{font-size:14px;color:var(--text);line-height:1.55}}
-.card img{{display:block;width:100%;height:auto}}
-.card .card-note{{padding:28px 24px;font-size:15px;line-height:1.7;color:var(--text)}}
-
-.footer{{text-align:center;color:var(--muted);font-size:11px;font-family:'IBM Plex Mono',monospace;
-         margin-top:48px;padding-top:20px;border-top:1px solid var(--border)}}
-</style></head><body>
+.list-wrap{flex:1;overflow-y:auto;padding:40px 24px 80px}
+.list-wrap.hidden{display:none}
+.list-inner{max-width:1020px;margin:0 auto}
+.card{background:var(--surface);border:1px solid var(--border);border-radius:10px;overflow:hidden;margin-bottom:28px}
+.card-hdr{display:flex;align-items:center;gap:14px;padding:14px 20px;border-bottom:1px solid var(--border)}
+.card-num{font-family:'IBM Plex Mono',monospace;font-size:10px;font-weight:600;color:var(--accent);
+           background:var(--accent12);padding:3px 10px;border-radius:4px;white-space:nowrap}
+.card-desc{font-size:14px;color:var(--text);line-height:1.55}
+.card img{display:block;width:100%;height:auto}
+.card .card-note{padding:28px 24px;font-size:15px;line-height:1.7;color:var(--text)}
+
+.footer{text-align:center;color:var(--muted);font-size:11px;font-family:'IBM Plex Mono',monospace;
+         margin-top:48px;padding-top:20px;border-top:1px solid var(--border)}
+""")
+
+# Page shell around the slides/cards. Plain str.format templates, so nothing is
+# re-parsed as an f-string on each export.
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en"><head>
+<meta charset="utf-8"><title>{title}</title>
+<style>
+{css}</style></head><body>
 
 <div class="topbar">
   <h1>{title}</h1>
@@ -3335,60 +3907,29 @@ body{{background:var(--bg);color:var(--text);font-family:'IBM Plex Sans',sans-se
       <p>{total} steps</p>
       <p style="margin-top:24px;font-size:12px;color:var(--muted)">Press &rarr; or click to begin</p>
     </div>
-""")
-            for i, entry in enumerate(log_data):
-                sn = entry["step"]
-                desc_html = _html.escape(entry['description'])
-                b64 = step_images[i]
-                if b64 is not None:
-                    body = (f'<div class="img-wrap">'
-                            f'<img src="data:image/png;base64,{b64}" alt="Step {sn}">'
-                            f'</div>')
-                else:
-                    body = f'<div class="note-body">{desc_html}</div>'
-                f.write(f"""    <div class="slide" data-idx="{i+1}">
-      <div class="step-hdr"><span class="step-num">STEP {sn:02d}</span><span class="step-desc">{desc_html}</span></div>
-      {body}
-    </div>
-""")
+"""
 
-            f.write(f"""  </div>
+_HTML_MID = """  </div>
   <div class="bottombar" id="dots"><span class="counter" id="counter">0 / {total}</span></div>
 </div>
 
 <!-- ═══════ LIST VIEW ═══════ -->
 <div class="list-wrap hidden" id="listWrap">
   <div class="list-inner">
-""")
-            for i, entry in enumerate(log_data):
-                sn = entry["step"]
-                desc_html = _html.escape(entry['description'])
-                b64 = step_images[i]
-                if b64 is not None:
-                    img_tag = f'\n    <img src="data:image/png;base64,{b64}" alt="Step {sn}">'
-                else:
-                    img_tag = f'\n    <div class="card-note">{desc_html}</div>'
-                f.write(f"""    <div class="card">
-      <div class="card-hdr"><span class="card-num">STEP {sn:02d}</span><span class="card-desc">{desc_html}</span></div>{img_tag}
-    </div>
-""")
-
-            f.write(f"""    <div class="footer">Generated by PSR Pro &middot; {gen_year}</div>
-  </div>
-</div>
+"""
 
-<script>
-/* ── view toggle ── */
+# Report script: plain JS, minified at import. __TOTAL__ is the only per-export value
+_HTML_JS = _minify_js("""/* ── view toggle ── */
 const deckWrap=document.getElementById('deckWrap'),
       listWrap=document.getElementById('listWrap'),
       toggleBtns=document.querySelectorAll('#viewToggle button');
 let mode='deck';
-function setMode(m){{
+function setMode(m){
   mode=m;
   deckWrap.classList.toggle('hidden',m!=='deck');
   listWrap.classList.toggle('hidden',m!=='list');
   toggleBtns.forEach(b=>b.classList.toggle('on',b.dataset.mode===m));
-}}
+}
 toggleBtns.forEach(b=>b.addEventListener('click',()=>setMode(b.dataset.mode)));
 
 /* ── deck navigation ── */
@@ -3399,56 +3940,298 @@ const slides=document.querySelectorAll('.slide'),
       nextBtn=document.getElementById('next'),
       N=slides.length;
 let cur=0;
-for(let i=0;i<N;i++){{
+for(let i=0;i<N;i++){
   const d=document.createElement('span');
   d.className='dot'+(i===0?' active':'');
   d.onclick=()=>goTo(i);
   dots.insertBefore(d,counter);
-}}
+}
 const allDots=dots.querySelectorAll('.dot');
-function goTo(i){{
+function goTo(i){
   if(i<0||i>=N)return;
   slides[cur].classList.remove('active');
   allDots[cur].classList.remove('active');
   cur=i;
   slides[cur].classList.add('active');
   allDots[cur].classList.add('active');
-  counter.textContent=cur===0?'0 / {total}':(cur+' / {total}');
+  counter.textContent=cur===0?'0 / __TOTAL__':(cur+' / __TOTAL__');
   prevBtn.classList.toggle('disabled',cur===0);
   nextBtn.classList.toggle('disabled',cur===N-1);
-}}
-function go(d){{goTo(cur+d)}}
-document.addEventListener('keydown',e=>{{
+}
+function go(d){goTo(cur+d)}
+document.addEventListener('keydown',e=>{
   if(mode!=='deck')return;
-  if(e.key==='ArrowRight'||e.key===' '){{e.preventDefault();go(1)}}
-  if(e.key==='ArrowLeft'){{e.preventDefault();go(-1)}}
-  if(e.key==='Home'){{e.preventDefault();goTo(0)}}
-  if(e.key==='End'){{e.preventDefault();goTo(N-1)}}
-}});
-document.getElementById('deck').addEventListener('click',e=>{{
+  if(e.key==='ArrowRight'||e.key===' '){e.preventDefault();go(1)}
+  if(e.key==='ArrowLeft'){e.preventDefault();go(-1)}
+  if(e.key==='Home'){e.preventDefault();goTo(0)}
+  if(e.key==='End'){e.preventDefault();goTo(N-1)}
+});
+document.getElementById('deck').addEventListener('click',e=>{
   if(e.target.closest('.nav'))return;
   go(1);
-}});
-</script>
-</body></html>""")
+});
+""")
+
+_HTML_FOOT = """    <div class="footer">Generated by PSR Pro &middot; {gen_year}</div>
+  </div>
+</div>
+
+<script>
+{js}</script>
+</body></html>"""
+
+# Per-step fragments of the HTML report (deck slide / list card). Bytes, so the base64
+# payloads go to the file as-is: (idx, sn, desc, body) / (mime, b64, sn) / (desc,)
+_HTML_SLIDE = b"""    <div class="slide" data-idx="%d">
+      <div class="step-hdr"><span class="step-num">STEP %02d</span><span class="step-desc">%s</span></div>
+      %s
+    </div>
+"""
+_HTML_SLIDE_IMG  = b'<div class="img-wrap"><img src="data:%s;base64,%s" alt="Step %d"></div>'
+_HTML_SLIDE_NOTE = b'<div class="note-body">%s</div>'
+_HTML_CARD = b"""    <div class="card">
+      <div class="card-hdr"><span class="card-num">STEP %02d</span><span class="card-desc">%s</span></div>%s
+    </div>
+"""
+_HTML_CARD_IMG  = b'\n    <img src="data:%s;base64,%s" alt="Step %d">'
+_HTML_CARD_NOTE = b'\n    <div class="card-note">%s</div>'
+
+_step_b64_cache: dict = {}   # step id → (content digest, base64 or None once it is on disk)
+_EXPORT_CACHE_DIR = ".cache"  # per-session folder persisting those strings across restarts
+
+
+def _export_step_snapshot(i, overlay):
+    """Copy of everything the HTML export needs for step i, taken on the UI thread so the
+    worker never reads log_data / step_objects while the user keeps editing."""
+    entry = log_data[i]
+    shot  = entry.get("screenshot")
+    crop  = step_crops[i]
+    return dict(sid=_step_id(entry), session=current_session,
+                path=os.path.join(current_session, shot) if shot else None,
+                objects=[_snapshot_obj(o) for o in step_objects[i]],
+                crop=dict(crop) if crop else None,
+                overlay=overlay, quality=html_image_quality)
+
+
+def _step_digest(snap):
+    """Hash of everything _flatten_image depends on: screenshot file, objects, crop, overlays."""
+    path = snap["path"] or ""
+    try:
+        mtime = os.path.getmtime(path) if path else 0
+    except OSError:
+        mtime = 0
+    payload = json.dumps([path, mtime, snap["objects"], snap["crop"], snap["overlay"],
+                          snap["quality"]],
+                         sort_keys=True)
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+
+def _b64_mime(b64):
+    """MIME type of a base64 image payload, read from its magic bytes."""
+    if b64.startswith(b"/9j/"):
+        return b"image/jpeg"
+    if b64.startswith(b"UklGR"):
+        return b"image/webp"
+    return b"image/png"
+
+
+def _encode_export_image(flat, quality_name):
+    """Encode a flattened step per quality_name (an html_image_quality value). Images with only a handful of
+    colours (text, redaction boxes) stay PNG, which is both smaller and sharp for them."""
+    buf = io.BytesIO()
+    quality = _HTML_QUALITY.get(quality_name)
+    if quality is None or flat.getcolors(256) is not None:
+        flat.save(buf, "PNG", compress_level=1)
+        return buf.getvalue()
+    rgb = flat.convert("RGB")
+    try:
+        rgb.save(buf, "WEBP", quality=quality, method=4)
+    except (OSError, KeyError, ValueError):
+        buf = io.BytesIO()
+        rgb.save(buf, "JPEG", quality=quality, optimize=True)
+    return buf.getvalue()
+
+
+def _step_image_b64(snap):
+    """Base64 image (ASCII bytes) of a step snapshot for HTML export, re-encoded only when the step changed since last time."""
+    sid    = snap["sid"]
+    digest = _step_digest(snap)
+    hit = _step_b64_cache.get(sid)
+    if hit is not None and hit[0] == digest and hit[1] is not None:
+        return hit[1]
+    cache_path = _export_cache_path(snap["session"], sid, digest)
+    try:
+        with open(cache_path, "rb") as f:
+            b64 = f.read()
+        _step_b64_cache[sid] = (digest, None)
+        return b64
+    except OSError:
+        pass
+    if snap["path"] is None:
+        _step_b64_cache.pop(sid, None)
+        return None
+    flat = _flatten_image(snap["path"], snap["objects"], snap["crop"], snap["overlay"])
+    if flat is None:
+        _step_b64_cache.pop(sid, None)
+        return None
+    b64 = _b64encode(_encode_export_image(flat, snap["quality"]))
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp = cache_path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(b64)
+        os.replace(tmp, cache_path)
+        _step_b64_cache[sid] = (digest, None)
+    except OSError as exc:
+        log.warning("Could not write export cache %s: %s", cache_path, exc)
+        _step_b64_cache[sid] = (digest, b64)
+    return b64
+
+
+def _export_cache_path(session, sid, digest):
+    return os.path.join(session, _EXPORT_CACHE_DIR, f"{sid}_{digest.hex()}.b64")
+
+
+def _prune_export_cache():
+    """Delete cached export images that no longer match any step's current content."""
+    keep = set()
+    for entry in log_data:
+        hit = _step_b64_cache.get(_step_id(entry))
+        if hit is not None:
+            keep.add(f"{entry['id']}_{hit[0].hex()}.b64")
+    try:
+        with os.scandir(os.path.join(current_session, _EXPORT_CACHE_DIR)) as it:
+            for e in it:
+                if e.name not in keep:
+                    try: os.remove(e.path)
+                    except OSError: pass
+    except OSError:
+        pass
+
+
+_html_export_queue: queue.Queue = queue.Queue()
+_html_export_busy = [False]
+_HTML_EXPORT_AHEAD = 4   # encoded step images held at once while the report streams to disk
+
+
+def export_html():
+    if not log_data:
+        messagebox.showwarning("Nothing to export", "No steps to export."); return
+    if _html_export_busy[0]:
+        _set_status("HTML export already in progress…", C["muted"]); return
+    _html_export_busy[0] = True
+    ids         = [_step_id(e) for e in log_data]
+    report_path = _export_filename("html")
+    now         = datetime.now()
+    page = dict(title=_html.escape(_export_title()), total=len(ids),
+                gen_date=now.strftime('%Y-%m-%d %H:%M'), gen_year=now.year)
+    step_nums = [e["step"] for e in log_data]
+    # Descriptions only land in element text, so quotes can stay as they are
+    escaped_descs = [_html.escape(e["description"], quote=False).encode("utf-8") for e in log_data]
+    overlay = [dict(g) for g in global_annotations]
+    snaps   = [_export_step_snapshot(i, overlay) for i in range(len(ids))]
+    _set_status(f"Exporting {len(ids)} steps to HTML…", C["accent"])
+    threading.Thread(target=_html_export_worker,
+                     args=(report_path + ".part", page, step_nums, escaped_descs, snaps),
+                     daemon=True).start()
+    root.after(50, lambda: _poll_html_export(ids, report_path))
+
+
+def _iter_step_images(snaps):
+    """Yield step images in order while a small pool encodes the next few ahead,
+    so at most _HTML_EXPORT_AHEAD of them are in memory at once."""
+    # PIL's resampling and zlib release the GIL, so the pool scales across cores
+    with ThreadPoolExecutor(max_workers=min(_HTML_EXPORT_AHEAD, os.cpu_count() or 4)) as ex:
+        pending = deque()
+        for snap in snaps:
+            pending.append(ex.submit(_step_image_b64, snap))
+            if len(pending) >= _HTML_EXPORT_AHEAD:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _html_export_worker(part_path, page, step_nums, escaped_descs, snaps):
+    """Stream the report to part_path off the UI thread, one step at a time. The list view
+    re-reads each image from the export cache instead of keeping the deck's copies."""
+    total = page["total"]
+    try:
+        with open(part_path, "wb", buffering=1 << 20) as f:
+            f.write(_HTML_HEAD.format(css=_HTML_CSS, **page).encode("utf-8"))
+            # Generators, not joined lists: writelines pulls one fragment at a time
+            f.writelines(
+                _HTML_SLIDE % (i + 1, sn, desc, _HTML_SLIDE_IMG % (_b64_mime(b64), b64, sn)
+                               if b64 is not None else _HTML_SLIDE_NOTE % (desc,))
+                for i, (sn, desc, b64) in enumerate(
+                    zip(step_nums, escaped_descs, _iter_step_images(snaps))))
+            f.write(_HTML_MID.format(**page).encode("utf-8"))
+            f.writelines(
+                _HTML_CARD % (sn, desc, _HTML_CARD_IMG % (_b64_mime(b64), b64, sn)
+                              if b64 is not None else _HTML_CARD_NOTE % (desc,))
+                for sn, desc, b64 in zip(step_nums, escaped_descs, map(_step_image_b64, snaps)))
+            js = _HTML_JS.replace("__TOTAL__", str(total))
+            f.write(_HTML_FOOT.format(js=js, **page).encode("utf-8"))
+        _html_export_queue.put(None)
     except Exception as exc:
+        _html_export_queue.put(exc)
+
+
+def _poll_html_export(ids, report_path):
+    try:
+        result = _html_export_queue.get_nowait()
+    except queue.Empty:
+        root.after(50, lambda: _poll_html_export(ids, report_path))
+        return
+    _html_export_busy[0] = False
+    part_path = report_path + ".part"
+    if isinstance(result, Exception):
+        try: os.remove(part_path)
+        except OSError: pass
+        log.error("HTML export failed: %s", result, exc_info=result)
+        messagebox.showerror("HTML Export Error", f"Failed to export HTML:\n{result}")
+        return
+    if [_step_id(e) for e in log_data] != ids:
+        try: os.remove(part_path)
+        except OSError: pass
+        _set_status("⚠ Steps changed during export — export again", C["warn"])
+        return
+    try:
+        os.replace(part_path, report_path)
+    except OSError as exc:
         log.exception("HTML export failed: %s", exc)
         messagebox.showerror("HTML Export Error", f"Failed to export HTML:\n{exc}")
         return
-
+    _prune_export_cache()
     _set_status("✔  HTML report exported", C["success"])
     webbrowser.open(os.path.abspath(report_path))
 
 
+def _pdf_step_jpeg(i):
+    """(JPEG buffer, width, height) of step i sized for a PDF page, or None for note steps."""
+    flat = _flatten_to_pil(i)
+    if flat is None:
+        return None
+    # Big downscales lose nothing visible to BILINEAR once JPEG-encoded
+    shrink = max(flat.width / 2600, flat.height / 1300)
+    flat.thumbnail((2600, 1300), Image.BILINEAR if shrink > 1.15 else Image.LANCZOS)
+    buf = io.BytesIO()
+    flat.save(buf, "JPEG", quality=88)
+    buf.seek(0)
+    return buf, flat.width, flat.height
+
+
 def export_pdf():
     if not log_data:
         messagebox.showwarning("Nothing to export", "No steps to export."); return
 
     title       = _pdf_safe(_export_title())
     report_path = _export_filename("pdf")
-    tmp_imgs    = []
 
     try:
+        # Flatten/resize/encode in parallel (PIL releases the GIL); fpdf2 itself stays serial
+        with ThreadPoolExecutor(max_workers=min(len(log_data), os.cpu_count() or 4)) as ex:
+            page_imgs = list(ex.map(_pdf_step_jpeg, range(len(log_data))))
+
         pdf = FPDF(orientation="L", unit="mm", format="A4")
         pdf.set_auto_page_break(auto=True, margin=16)
         pdf.set_margins(16, 16, 16)
@@ -3470,26 +4253,18 @@ def export_pdf():
             desc = entry["description"]
             pdf.cell(0, 9, _pdf_safe(desc[:117] + "…" if len(desc) > 120 else desc), new_x="LMARGIN", new_y="NEXT")
 
-            flat = _flatten_to_pil(i)
-            if flat is not None:
-                flat.thumbnail((2600, 1300), Image.LANCZOS)
-                tmp  = os.path.join(current_session, f"_tmp_{i}.jpg")
-                flat.save(tmp, "JPEG", quality=88)
-                tmp_imgs.append(tmp)
-                iw, ih = flat.size
+            page_img = page_imgs[i]
+            if page_img is not None:
+                buf, iw, ih = page_img
                 ratio  = min(265/iw, 176/ih)
                 fw, fh = iw*ratio, ih*ratio
-                pdf.image(tmp, x=(297-fw)/2, y=24, w=fw, h=fh)
+                pdf.image(buf, x=(297-fw)/2, y=24, w=fw, h=fh)
 
         pdf.output(report_path)
     except Exception as exc:
         log.exception("PDF export failed: %s", exc)
         messagebox.showerror("PDF Export Error", f"Failed to export PDF:\n{exc}")
         return
-    finally:
-        for t in tmp_imgs:
-            try: os.remove(t)
-            except Exception: pass
 
     _set_status("✔  PDF report exported", C["success"])
     _open_folder(report_path)
@@ -3640,8 +4415,10 @@ for hex_col, col_lbl in _SWATCHES:
         command=lambda c=hex_col: _set_draw_color_global(c))
     sw.pack(side="left", padx=2, pady=12)
     draw_color_btns.append((sw, hex_col))
+    _color_btn_map[hex_col] = sw
     tip(sw, col_lbl)
 draw_color_btns[0][0].configure(border_width=2, border_color="#ffffff")
+_painted_color[0] = draw_color_btns[0][1]
 
 def _open_color_picker():
     from tkinter import colorchooser
@@ -3672,6 +4449,9 @@ for _plbl, _ppx, _ptip in (("S", 2, "2 px"), ("M", 5, "5 px"), ("L", 10, "10 px"
         command=lambda w=_ppx: _set_draw_width_global(w))
     pb.pack(side="left", padx=2, pady=9)
     pen_size_btns.append((pb, _ppx))
+    _pen_btn_map[_ppx] = pb
+    if _plbl == "S":
+        _painted_width[0] = _ppx
     tip(pb, f"Pen width: {_ptip}")
 
 # Draw-only widgets start hidden (default tool is Pointer)
@@ -3681,6 +4461,7 @@ for _w in pen_size_btns:
     _w[0].pack_forget()
 _draw_sep1.pack_forget()
 _draw_sep2.pack_forget()
+_tool_opts_shown[0] = (False, False)
 
 status_label = ctk.CTkLabel(tool_strip, text="◼  Ready",
     font=("Segoe UI", 9), text_color=C["muted"])
@@ -3806,6 +4587,18 @@ def _pin_scroll_width(event):
     except Exception:
         pass
 cards_scroll._parent_canvas.bind("<Configure>", _pin_scroll_width)
+
+def _on_cards_yview(first, last):
+    """Scrollbar update hook — fires for wheel, scrollbar drags and content resizes alike."""
+    cards_scroll._scrollbar.set(first, last)
+    if _card_drag["active"]:
+        _card_geom_cache.clear()   # auto-scroll / lazy loads move cards while dragging
+    _on_cards_scroll()
+cards_scroll._parent_canvas.configure(yscrollcommand=_on_cards_yview)
+cards_scroll._parent_canvas.bind("<Configure>", lambda e: _card_geom_cache.clear(), add="+")
+root.bind_class(_CARD_TAG_ANY,   "<Button-3>",        _on_card_right)
+root.bind_class(_CARD_TAG_CLICK, "<ButtonPress-1>",   _on_card_left)
+root.bind_class(_CARD_TAG_CLICK, "<Double-Button-1>", _on_card_dbl)
 cards_scroll.bind_all("<MouseWheel>", lambda e: _on_cards_scroll(), add="+")
 
 
@@ -3850,16 +4643,17 @@ _rec_minimized = [False]
 
 def _minimize_rec_tray():
     _rec_minimized[0] = True
-    root.overrideredirect(False)
+    _set_wm(overrideredirect=False)
     root.iconify()
+    _forget_wm()
 
 def _restore_rec_tray():
     if not _rec_minimized[0]:
         return
     _rec_minimized[0] = False
     root.deiconify()
-    root.overrideredirect(True)
-    root.attributes("-topmost", True)
+    _forget_wm()
+    _set_wm(overrideredirect=True, topmost=True)
     root.lift()
 
 _rec_hide_btn = ctk.CTkButton(_rec_row1, text="▾", command=_minimize_rec_tray,
@@ -3966,7 +4760,7 @@ def _toggle_settings_flyout():
         ).pack(side="left", padx=(4, 0))
 
     row_f = ctk.CTkFrame(pad, fg_color="transparent")
-    row_f.pack(fill="x", padx=10, pady=(2, 8))
+    row_f.pack(fill="x", padx=10, pady=2)
     ctk.CTkLabel(row_f, text="Format", font=("Segoe UI", 10),
         text_color=C["muted"], width=48).pack(side="left")
 
@@ -3978,6 +4772,29 @@ def _toggle_settings_flyout():
     ctk.CTkOptionMenu(row_f, variable=_fmt_var_local, values=["JPG", "PNG"], width=70, **_DDS
         ).pack(side="left", padx=(4, 0))
 
+    _palette_var = tk.BooleanVar(value=capture_png_palette)
+    def _on_palette(*_a):
+        global capture_png_palette
+        capture_png_palette = _palette_var.get()
+    _palette_var.trace_add("write", _on_palette)
+    _palette_cb = ctk.CTkCheckBox(row_f, text="256 col", variable=_palette_var,
+        text_color=C["text"], **_CBO)
+    _palette_cb.pack(side="left", padx=(8, 0))
+    tip(_palette_cb, "PNG only: quantize to 256 colours — ~3x smaller files, but no longer lossless")
+
+    row_h = ctk.CTkFrame(pad, fg_color="transparent")
+    row_h.pack(fill="x", padx=10, pady=(2, 8))
+    ctk.CTkLabel(row_h, text="HTML", font=("Segoe UI", 10),
+        text_color=C["muted"], width=48).pack(side="left")
+
+    _html_q_var = tk.StringVar(value=html_image_quality.capitalize())
+    def _on_html_q(*_a):
+        global html_image_quality
+        html_image_quality = _html_q_var.get().lower()
+    _html_q_var.trace_add("write", _on_html_q)
+    ctk.CTkOptionMenu(row_h, variable=_html_q_var, values=["Lossless", "High", "Medium"],
+        width=90, **_DDS).pack(side="left", padx=(4, 0))
+
     _rec_flyout.update_idletasks()
     _rec_flyout.geometry(f"+{x}+{y}")
 
@@ -4072,7 +4889,15 @@ def _toggle_pause():
     _update_rec_panel()
 
 
+_rec_panel_state = [None]   # inputs _update_rec_panel last rendered
+
+
 def _update_rec_panel():
+    state = (project_name, len(log_data), paused, recording,
+             capture_on_click, capture_keyboard, capture_on_hotkey, _last_capture[0])
+    if _rec_panel_state[0] == state:
+        return
+    _rec_panel_state[0] = state
     _rec_project.configure(text=project_name or "Untitled")
     count = len(log_data)
     _rec_steps.configure(text=str(count))
@@ -4177,148 +5002,290 @@ ctk.CTkButton(_home_actions, text="📂  Open",
     command=load_recording
 ).pack(side="left")
 
-_home_recents_inner = [None]
+_recents_cache: dict = {}   # folder → (steps.json mtime, project name, step count)
+_RECENTS_MAX = 3
+
+def _paint_recent_row(i, hover):
+    _sep, row, _n, _m, arrow = _recent_rows[i]
+    row.configure(fg_color=C["surface"] if hover else "transparent")
+    arrow.configure(text_color=C["accent"] if hover else C["muted"])
+
+
+_recent_opening = [False]
+
+
+def _on_recent_click(i):
+    """Paint a 'Loading…' state first and open the recording at idle, so the click
+    gets visible feedback before the (blocking) load starts."""
+    if _recent_opening[0]:
+        return
+    _recent_opening[0] = True
+    _paint_recent_row(i, False)   # the row is reused, so don't leave it painted as hovered
+    _sep, row, _name, meta_lbl, _arrow = _recent_rows[i]
+    meta_lbl.configure(text="  Loading…")
+    root.configure(cursor="watch")
+    root.after_idle(lambda: _open_recent(_recent_row_folder[row]))
+
+
+# Recents widgets are built once and re-filled by _refresh_home
+_home_recents = ctk.CTkFrame(_home_center, fg_color="transparent")
+_home_recents.pack(pady=(20, 0))
+_recents_empty = ctk.CTkLabel(_home_recents, text="No recordings yet.",
+    font=("Segoe UI", 9), text_color=C["muted"])
+_recents_header = ctk.CTkLabel(_home_recents, text="RECENT",
+    font=("Segoe UI", 9, "bold"), text_color=C["muted"])
+_recent_rows = []               # (separator or None, row, name_lbl, meta_lbl, arrow_lbl)
+_recent_row_folder: dict = {}   # row frame → recording folder it currently opens
+
+for _ri in range(_RECENTS_MAX):
+    _sep = ctk.CTkFrame(_home_recents, height=1, fg_color=C["border"]) if _ri > 0 else None
+    _row = ctk.CTkFrame(_home_recents, fg_color="transparent", cursor="hand2")
+    _name_lbl = ctk.CTkLabel(_row, text="",
+        font=("Segoe UI", 10), text_color=C["text"], anchor="w")
+    _name_lbl.pack(side="left", pady=5)
+    _meta_lbl = ctk.CTkLabel(_row, text="",
+        font=("Segoe UI", 9), text_color=C["muted"])
+    _meta_lbl.pack(side="left")
+    _arrow_lbl = ctk.CTkLabel(_row, text="→",
+        font=("Segoe UI", 10), text_color=C["muted"], width=20)
+    _arrow_lbl.pack(side="right", pady=5)
+    _recent_rows.append((_sep, _row, _name_lbl, _meta_lbl, _arrow_lbl))
+
+    for _w in (_row, _name_lbl, _meta_lbl, _arrow_lbl):
+        _w.bind("<Button-1>", lambda _e, i=_ri: _on_recent_click(i))
+        _w.bind("<Enter>",    lambda _e, i=_ri: _paint_recent_row(i, True))
+        _w.bind("<Leave>",    lambda _e, i=_ri: _paint_recent_row(i, False))
+
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@functools.lru_cache(maxsize=256)
+def _day_label(ts):
+    """'Mar 07'-style date for a whole-second timestamp; recents rarely change between shows."""
+    tm = time.localtime(ts)
+    return f"{_MONTHS[tm.tm_mon - 1]} {tm.tm_mday:02d}"
 
 
 def _open_recent(folder):
-    if _do_load_recording(folder):
+    try:
+        ok = _do_load_recording(folder)
+    finally:
+        root.configure(cursor="")
+        _recent_opening[0] = False
+    if ok:
         show_editing()
+    elif _recents_shown[0] is not None:
+        _render_recents(_recents_shown[0])   # put the row's date/step count back
+
+
+_recents_queue: queue.Queue = queue.Queue()
+_recents_scan_busy = [False]
+_recents_shown     = [None]   # last recents list rendered (None until the first scan lands)
+_recents_packed    = [None]   # number of recents rows currently packed
 
 
 def _refresh_home():
-    if _home_recents_inner[0]:
-        try: _home_recents_inner[0].destroy()
-        except Exception: pass
+    """Keep showing the last known recents and rescan BASE_DIR off the UI thread."""
+    if _recents_shown[0] is None:
+        _recents_empty.configure(text="Loading…")
+        _recents_empty.pack(pady=4)
+    if _recents_scan_busy[0]:
+        return
+    _recents_scan_busy[0] = True
+    threading.Thread(target=_recents_worker, daemon=True).start()
+    root.after(50, _poll_recents)
 
-    container = ctk.CTkFrame(_home_center, fg_color="transparent")
-    container.pack(pady=(20, 0))
-    _home_recents_inner[0] = container
 
-    recent = []
-    if os.path.isdir(BASE_DIR):
-        for name in sorted(os.listdir(BASE_DIR)):
-            folder = os.path.join(BASE_DIR, name)
-            json_path = os.path.join(folder, "steps.json")
-            if os.path.isdir(folder) and os.path.exists(json_path):
-                try:
-                    mtime = os.path.getmtime(json_path)
-                    with open(json_path, encoding="utf-8") as f:
-                        raw = json.load(f)
-                    if isinstance(raw, list):
-                        pname  = name
-                        nsteps = len(raw)
-                    else:
-                        pname  = raw.get("project_name") or name
-                        nsteps = len(raw.get("steps", []))
-                    recent.append((mtime, pname, nsteps, folder))
-                except Exception:
-                    pass
+def _recents_worker():
+    try:
+        _recents_queue.put(_scan_recents())
+    except Exception as exc:
+        log.warning("Scanning recent recordings failed: %s", exc)
+        _recents_queue.put([])
 
-    recent.sort(reverse=True)
-    recent = recent[:3]
 
-    if not recent:
-        ctk.CTkLabel(container,
-            text="No recordings yet.",
-            font=("Segoe UI", 9), text_color=C["muted"]
-        ).pack(pady=4)
+def _poll_recents():
+    try:
+        recent = _recents_queue.get_nowait()
+    except queue.Empty:
+        root.after(50, _poll_recents)
         return
+    _recents_scan_busy[0] = False
+    _recents_shown[0] = recent
+    _render_recents(recent)
+
+
+# save_steps() writes json.dump(indent=4) with project_name first, so the name and the
+# step count can be read off the raw bytes: every step object opens on its own line at
+# depth 2, and JSON strings cannot contain a raw newline. The file is written in text
+# mode, so on Windows lines end in \r\n; _STEP_OPEN only looks after the \r.
+_RE_PROJECT_NAME = re.compile(rb'^\{\s*"project_name": ("(?:[^"\\]|\\.)*"),\r?\n    "steps": \[')
+_STEP_OPEN = b"\n        {"
+
+
+def _peek_recording(json_path, name):
+    """(project name, step count) of a recording, without decoding the steps."""
+    with open(json_path, "rb") as f:
+        data = f.read()
+    m = _RE_PROJECT_NAME.match(data)
+    if m is not None:
+        return json.loads(m.group(1)) or name, data.count(_STEP_OPEN, m.end())
+    # Older list-only files or hand-edited layouts: full parse
+    raw = _json_loads(data)
+    if isinstance(raw, list):
+        return name, len(raw)
+    return raw.get("project_name") or name, len(raw.get("steps", []))
 
-    ctk.CTkLabel(container, text="RECENT",
-        font=("Segoe UI", 9, "bold"), text_color=C["muted"]
-    ).pack(anchor="w", pady=(0, 4))
-
-    for i, (mtime, pname, nsteps, folder) in enumerate(recent):
-        if i > 0:
-            ctk.CTkFrame(container, height=1, fg_color=C["border"]).pack(fill="x")
-
-        row = ctk.CTkFrame(container, fg_color="transparent", cursor="hand2")
-        row.pack(fill="x")
-
-        date_str = datetime.fromtimestamp(mtime).strftime("%b %d")
-        name_lbl = ctk.CTkLabel(row,
-            text=pname or os.path.basename(folder),
-            font=("Segoe UI", 10), text_color=C["text"], anchor="w")
-        name_lbl.pack(side="left", pady=5)
-
-        meta_lbl = ctk.CTkLabel(row,
-            text=f"  {date_str} · {nsteps}s",
-            font=("Segoe UI", 9), text_color=C["muted"])
-        meta_lbl.pack(side="left")
-
-        arrow_lbl = ctk.CTkLabel(row, text="→",
-            font=("Segoe UI", 10), text_color=C["muted"], width=20)
-        arrow_lbl.pack(side="right", pady=5)
-
-        def _make_handlers(f, r, a):
-            def _click(_e):  _open_recent(f)
-            def _enter(_e):
-                r.configure(fg_color=C["surface"])
-                a.configure(text_color=C["accent"])
-            def _leave(_e):
-                r.configure(fg_color="transparent")
-                a.configure(text_color=C["muted"])
-            return _click, _enter, _leave
-
-        _click, _enter, _leave = _make_handlers(folder, row, arrow_lbl)
-        for w in (row, name_lbl, meta_lbl, arrow_lbl):
+
+def _scan_recents():
+    """Newest recordings as (mtime, project name, step count, folder). Worker thread only."""
+    # Phase 1: stat only. Phase 2 below parses just the few newest recordings.
+    candidates = []
+    # One directory enumeration (a missing BASE_DIR just means no recordings yet); is_dir()
+    # reuses its cached entry type, and one stat of steps.json both proves it exists and
+    # yields the mtime
+    try:
+        with os.scandir(BASE_DIR) as it:
+            entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+    except (FileNotFoundError, NotADirectoryError):
+        entries = []
+    for e in entries:
+        folder = e.path
+        json_path = os.path.join(folder, "steps.json")
+        try:
+            candidates.append((-os.stat(json_path).st_mtime, folder, e.name, json_path))
+        except OSError:
+            pass
+    for folder in _recents_cache.keys() - {c[1] for c in candidates}:
+        del _recents_cache[folder]
+
+    # Heap keyed on -mtime: O(N) to build, then pop only until the rows are filled
+    # (a spare is popped whenever a file turns out unreadable)
+    heapq.heapify(candidates)
+    recent = []
+    while candidates:
+        neg_mtime, folder, name, json_path = heapq.heappop(candidates)
+        mtime = -neg_mtime
+        hit = _recents_cache.get(folder)
+        if hit is None or hit[0] != mtime:
             try:
-                w.bind("<Button-1>", _click)
-                w.bind("<Enter>",    _enter)
-                w.bind("<Leave>",    _leave)
+                hit = (mtime, *_peek_recording(json_path, name))
             except Exception:
-                pass
+                continue   # unreadable recording: the next newest takes its place
+            _recents_cache[folder] = hit
+        recent.append((*hit, folder))
+        if len(recent) == _RECENTS_MAX:
+            break
+    return recent
+
+
+def _render_recents(recent):
+    n = len(recent)
+    if _recents_packed[0] != n:
+        # Re-pack with the container detached, so Tk lays it out once on re-attach
+        _home_recents.pack_forget()
+        _recents_empty.pack_forget()
+        _recents_header.pack_forget()
+        for sep, row, *_ in _recent_rows:
+            if sep is not None:
+                sep.pack_forget()
+            row.pack_forget()
+        if not n:
+            _recents_empty.configure(text="No recordings yet.")
+            _recents_empty.pack(pady=4)
+        else:
+            _recents_header.pack(anchor="w", pady=(0, 4))
+            for sep, row, *_ in _recent_rows[:n]:
+                if sep is not None:
+                    sep.pack(fill="x")
+                row.pack(fill="x")
+        _home_recents.pack(pady=(20, 0))
+        _recents_packed[0] = n
+
+    for (_s, row, name_lbl, meta_lbl, _a), (mtime, pname, nsteps, folder) in zip(_recent_rows, recent):
+        name_lbl.configure(text=pname or os.path.basename(folder))
+        meta_lbl.configure(text=f"  {_day_label(int(mtime))} · {nsteps}s")
+        _recent_row_folder[row] = folder
 
 
 # ══════════════════════════════════════ PANEL SWITCHING ══════════════════════════════════════
 
+_current_panel = [None]
+_wm_state: dict = {}   # window-manager settings last applied through _set_wm
+
+
+def _set_wm(**state):
+    """Apply window-manager settings (overrideredirect, geometry, minsize, resizable,
+    topmost, title), skipping any that already have the requested value. Geometry is
+    always applied: the user and the WM move and resize the window behind our back."""
+    for key, value in state.items():
+        if key != "geometry":
+            if _wm_state.get(key) == value:
+                continue
+            _wm_state[key] = value
+        if key == "overrideredirect":
+            root.overrideredirect(value)
+        elif key == "geometry":
+            root.geometry(value)
+        elif key == "minsize":
+            root.minsize(*value)
+        elif key == "resizable":
+            root.resizable(*value)
+        elif key == "topmost":
+            root.attributes("-topmost", value)
+        elif key == "title":
+            root.title(value)
+
+
+def _forget_wm():
+    """Drop the _set_wm cache after iconify/deiconify/state(), which change WM state directly."""
+    _wm_state.clear()
+
+
+def _show_panel(panel):
+    if _current_panel[0] is panel:
+        return
+    for p in (home_panel, rec_panel, edit_panel):
+        if p is not panel:
+            p.pack_forget()
+    panel.pack(fill="both", expand=True)
+    _current_panel[0] = panel
+
+
 def show_home():
     _close_rec_settings()
-    rec_panel.pack_forget()
-    edit_panel.pack_forget()
-    root.overrideredirect(False)
     _refresh_home()
-    home_panel.pack(fill="both", expand=True)
-    root.geometry("700x520")
-    root.minsize(560, 400)
-    root.resizable(True, True)
-    root.attributes("-topmost", False)
-    root.title("PSR Pro — Process Step Recorder")
+    _set_wm(overrideredirect=False)
+    _show_panel(home_panel)
+    _set_wm(geometry="700x520", minsize=(560, 400), resizable=(True, True), topmost=False,
+            title="PSR Pro — Process Step Recorder")
     # Restore toolbar button to its default label for when we return to edit mode
     btn_start.configure(text="▶  Start")
     tip(btn_start, "Start a new recording")
 
 
 def show_recording():
-    home_panel.pack_forget()
-    edit_panel.pack_forget()
     _update_rec_panel()
-    rec_panel.pack(fill="both", expand=True)
+    _show_panel(rec_panel)
     # Leave fullscreen/zoomed so the tray is actually small (not fullscreen)
     try:
         root.state("normal")
     except Exception:
         pass
+    _forget_wm()
     sw = root.winfo_screenwidth()
-    root.overrideredirect(True)
     w = 280
-    root.geometry(f"{w}x64+{(sw - w) // 2}+8")
-    root.minsize(220, 64)
-    root.resizable(True, False)
-    root.attributes("-topmost", True)
+    _set_wm(overrideredirect=True, geometry=f"{w}x64+{(sw - w) // 2}+8", minsize=(220, 64),
+            resizable=(True, False), topmost=True)
 
 
 def show_editing():
     _close_rec_settings()
-    home_panel.pack_forget()
-    rec_panel.pack_forget()
-    root.overrideredirect(False)
-    edit_panel.pack(fill="both", expand=True)
-    root.geometry("1500x900")
-    root.minsize(960, 640)
-    root.resizable(True, True)
-    root.attributes("-topmost", False)
-    root.title(f"PSR Pro — {project_name}" if project_name else "PSR Pro — Process Step Recorder")
+    _set_wm(overrideredirect=False)
+    _show_panel(edit_panel)
+    _set_wm(geometry="1500x900", minsize=(960, 640), resizable=(True, True), topmost=False,
+            title=f"PSR Pro — {project_name}" if project_name else "PSR Pro — Process Step Recorder")
     # In edit mode "Start" means "new recording", not "start the current one"
     btn_start.configure(text="▶  New")
     tip(btn_start, "Start a new recording — replaces current session")
@@ -4333,37 +5300,56 @@ def show_editing():
 
 # ══════════════════════════════════════ KEYBOARD SHORTCUTS ══════════════════════════
 
-_TEXT_FOCUS_CLASSES = ("Text", "Entry", "TEntry", "Spinbox", "TSpinbox")
+_TEXT_FOCUS_CLASSES = frozenset(("Text", "Entry", "TEntry", "Spinbox", "TSpinbox"))
+_focus_is_text = [False]   # updated on every <FocusIn>, so shortcuts needn't ask Tk
+
+
+def _track_focus(event):
+    try:
+        _focus_is_text[0] = event.widget.winfo_class() in _TEXT_FOCUS_CLASSES
+    except (tk.TclError, AttributeError):   # widget already gone / focus event on a string path
+        _focus_is_text[0] = False
+
 
 def _focus_in_text_input():
     """True if keyboard focus is in a text/entry widget (don't steal shortcuts)."""
+    if not _focus_is_text[0]:
+        return False
+    # A focused entry can be destroyed without a FocusIn elsewhere; confirm the rare positive
     focus = root.focus_get()
-    return focus and focus.winfo_class() in _TEXT_FOCUS_CLASSES
+    _focus_is_text[0] = bool(focus) and focus.winfo_class() in _TEXT_FOCUS_CLASSES
+    return _focus_is_text[0]
 
 
 def _on_root_key(event):
     if event.keysym in ("Delete", "BackSpace"):
+        card = active_card_ref[0]
+        obj_selected = (card is not None and not card.is_text_only
+                        and getattr(card, "_selected_obj", None) is not None)
+        # Nothing to delete (the common case): don't ask Tk about focus at all
+        if not obj_selected and not _selected:
+            return
         if _focus_in_text_input():
             return
         # Annotation delete takes priority over step delete
-        card = active_card_ref[0]
-        if (card is not None and not card.is_text_only
-                and hasattr(card, '_selected_obj') and card._selected_obj is not None):
+        if obj_selected:
             card.delete_selected()
             return "break"
-        if _selected:
-            _delete_selected()
-            return "break"
+        _delete_selected()
+        return "break"
+
+
+_TOOL_KEYS = {'v': 'none', 'u': 'highlight', 'm': 'redact', 'c': 'crop', 'b': 'draw'}
 
 
 def _on_tool_hotkey(event):
-    if _focus_in_text_input():
+    if not event.char:
         return
-    _TOOL_KEYS = {'v': 'none', 'u': 'highlight', 'm': 'redact', 'c': 'crop', 'b': 'draw'}
     tool = _TOOL_KEYS.get(event.char.lower())
-    if tool:
-        set_tool(tool)
-        return "break"
+    if tool is None or _focus_in_text_input():
+        return
+    set_tool(tool)
+    return "break"
 
 
 def _on_undo(event=None):
@@ -4381,17 +5367,18 @@ def _on_map(event):
         root.after(50, _restore_rec_tray)
 
 root.bind("<Map>", _on_map)
+root.bind_all("<FocusIn>", _track_focus, add="+")
 root.bind("<Delete>",    _on_root_key)
 root.bind("<BackSpace>", _on_root_key)
 root.bind("<Control-v>", _handle_paste)
+# CapsLock also yields the uppercase keysym, so only Shift selects the image-only paste
+root.bind("<Control-V>", lambda e: _handle_paste(e, prefer_image=(e.state & 0x0001) != 0))
 root.bind("<Control-z>", _on_undo)
 root.bind("<Control-o>", lambda e: load_recording())
 root.bind("<Control-O>", lambda e: load_recording())
 root.bind("<Control-Shift-H>", lambda e: export_html())
 root.bind("<Control-Shift-P>", lambda e: export_pdf())
-for _hk in ('v', 'u', 'm', 'c', 'b'):
-    root.bind(f"<KeyPress-{_hk}>", _on_tool_hotkey)
-    root.bind(f"<KeyPress-{_hk.upper()}>", _on_tool_hotkey)
+root.bind("<Key>", _on_tool_hotkey)   # tool hotkeys; the more specific bindings above still win
 
 
 # ══════════════════════════════════════ START ══════════════════════════════════════